@@ -243,8 +243,8 @@ class IMAPClient:
             # 検索条件を構築
             search_criteria = 'UNSEEN' if unread_only else 'ALL'
             
-            # メッセージIDを検索
-            result, data = self._connection.search(None, search_criteria)
+            # メッセージのUIDを検索（番号は削除で詰められるため、UIDで扱う）
+            result, data = self._connection.uid('SEARCH', None, search_criteria)
             
             if result != 'OK' or not data[0]:
                 logger.debug(f"メッセージが見つかりません: {folder_name}")
@@ -284,7 +284,7 @@ class IMAPClient:
         単一のメッセージを取得します
         
         Args:
-            msg_id: メッセージID
+            msg_id: メッセージのUID
             folder_name: フォルダ名
             
         Returns:
@@ -292,7 +292,7 @@ class IMAPClient:
         """
         try:
             # メッセージの詳細情報を取得
-            result, data = self._connection.fetch(msg_id, '(RFC822 FLAGS)')
+            result, data = self._connection.uid('FETCH', msg_id, '(RFC822 FLAGS)')
             
             if result != 'OK' or not data:
                 return None
@@ -340,7 +340,7 @@ class IMAPClient:
             return False
         
         try:
-            result, _ = self._connection.store(message_uid, '+FLAGS', '\\Seen')
+            result, _ = self._connection.uid('STORE', message_uid, '+FLAGS', '\\Seen')
             if result == 'OK':
                 logger.debug(f"メッセージを既読にマークしました: {message_uid}")
                 return True
@@ -366,7 +366,7 @@ class IMAPClient:
             return False
         
         try:
-            result, _ = self._connection.store(message_uid, '-FLAGS', '\\Seen')
+            result, _ = self._connection.uid('STORE', message_uid, '-FLAGS', '\\Seen')
             if result == 'OK':
                 logger.debug(f"メッセージを未読にマークしました: {message_uid}")
                 return True
@@ -378,6 +378,52 @@ class IMAPClient:
             logger.error(f"未読マークエラー: {e}")
             return False
     
+    def batch_update_flags(self, folder_name: str, message_uids: List[str],
+                           add_flags: Tuple[str, ...] = (),
+                           remove_flags: Tuple[str, ...] = ()) -> bool:
+        """
+        複数メッセージのフラグをまとめて更新します
+        
+        メッセージのUIDをカンマ区切りの集合にまとめ、追加・削除それぞれ
+        1回のUID STOREコマンドで反映します。
+        
+        Args:
+            folder_name: メッセージが属するフォルダ名
+            message_uids: メッセージUIDのリスト
+            add_flags: 追加するフラグ（例: "\\Seen"）
+            remove_flags: 削除するフラグ
+        
+        Returns:
+            bool: 成功時True、失敗時False
+        """
+        if not message_uids:
+            return True
+        
+        if not self.is_connected():
+            return False
+        
+        if self._current_folder != folder_name and not self.select_folder(folder_name):
+            return False
+        
+        uid_set = ",".join(message_uids)
+        
+        try:
+            for command, flags in (('+FLAGS', add_flags), ('-FLAGS', remove_flags)):
+                if not flags:
+                    continue
+                result, _ = self._connection.uid('STORE', uid_set, command, f"({' '.join(flags)})")
+                if result != 'OK':
+                    logger.error(f"フラグ一括更新失敗: {command} {flags} ({len(message_uids)}件)")
+                    return False
+            
+            logger.debug(f"フラグを一括更新しました: {len(message_uids)}件 "
+                         f"(+{list(add_flags)} -{list(remove_flags)})")
+            return True
+        
+        except Exception as e:
+            logger.error(f"フラグ一括更新エラー: {e}")
+            return False
+    
     def delete_message(self, message_uid: str) -> bool:
         """
         メッセージを削除します
@@ -393,7 +439,7 @@ class IMAPClient:
         
         try:
             # 削除フラグを設定
-            result, _ = self._connection.store(message_uid, '+FLAGS', '\\Deleted')
+            result, _ = self._connection.uid('STORE', message_uid, '+FLAGS', '\\Deleted')
             if result != 'OK':
                 logger.error(f"削除フラグ設定失敗: {message_uid}")
                 return False
@@ -408,6 +454,47 @@ class IMAPClient:
             logger.error(f"メッセージ削除エラー: {e}")
             return False
     
+    def batch_delete(self, folder_name: str, message_uids: List[str]) -> bool:
+        """
+        複数メッセージをまとめて削除します
+        
+        削除フラグの設定を1回のUID STOREにまとめ、最後に1回だけExpungeします。
+        UIDはExpungeの後も変わらないため、他のメッセージの指定には影響しません。
+        
+        Args:
+            folder_name: メッセージが属するフォルダ名
+            message_uids: メッセージUIDのリスト
+        
+        Returns:
+            bool: 成功時True、失敗時False
+        """
+        if not message_uids:
+            return True
+        
+        if not self.is_connected():
+            return False
+        
+        if self._current_folder != folder_name and not self.select_folder(folder_name):
+            return False
+        
+        uid_set = ",".join(message_uids)
+        
+        try:
+            result, _ = self._connection.uid('STORE', uid_set, '+FLAGS', '(\\Deleted)')
+            if result != 'OK':
+                logger.error(f"削除フラグ一括設定失敗: {len(message_uids)}件")
+                return False
+            
+            # Expungeで実際に削除
+            self._connection.expunge()
+            
+            logger.debug(f"メッセージを一括削除しました: {len(message_uids)}件")
+            return True
+        
+        except Exception as e:
+            logger.error(f"メッセージ一括削除エラー: {e}")
+            return False
+    
     def move_message(self, message_uid: str, destination_folder: str) -> bool:
         """
         メッセージを他のフォルダに移動します
@@ -424,14 +511,14 @@ class IMAPClient:
         
         try:
             # IMAPのMOVE機能を使用（対応していない場合はCOPY+DELETE）
-            try:
-                result, _ = self._connection.move(message_uid, destination_folder)
+            if 'MOVE' in self._connection.capabilities:
+                result, _ = self._connection.uid('MOVE', message_uid, destination_folder)
                 if result == 'OK':
                     logger.debug(f"メッセージを移動しました: {message_uid} -> {destination_folder}")
                     return True
-            except AttributeError:
+            else:
                 # MOVEが対応していない場合はCOPY+DELETEで代替
-                result, _ = self._connection.copy(message_uid, destination_folder)
+                result, _ = self._connection.uid('COPY', message_uid, destination_folder)
                 if result == 'OK':
                     return self.delete_message(message_uid)
             
@@ -334,6 +334,29 @@ class MailMessage:
         if flag in self.flags:
             self.flags.remove(flag)
     
+    def update_flags(self, add_flags=(), remove_flags=()) -> bool:
+        """
+        複数のフラグをまとめて追加・削除します
+        
+        集合演算で新しいフラグを求め、変化がある場合だけ1回で置き換えます。
+        
+        Args:
+            add_flags: 追加するフラグ
+            remove_flags: 削除するフラグ
+        
+        Returns:
+            bool: フラグが変化した場合True
+        """
+        current = set(self.flags)
+        new = (current | set(add_flags)) - set(remove_flags)
+        if new == current:
+            return False
+        
+        # 既存フラグの順序を保ち、新しいフラグは末尾に追加する
+        self.flags = ([flag for flag in self.flags if flag in new] +
+                      [flag for flag in dict.fromkeys(add_flags) if flag in new and flag not in current])
+        return True
+    
     def is_read(self) -> bool:
         """
         既読かどうかをチェックします
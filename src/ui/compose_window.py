@@ -10,10 +10,16 @@ Created: 2025-07-01
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from typing import List, Optional, Dict, Any, Callable
-import threading
+from tkinter import ttk, filedialog
+from typing import List, Optional, Dict, Any, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import functools
+import operator
 import os
+import re
+import html
+import mimetypes
 from pathlib import Path
 from datetime import datetime
 import tempfile
@@ -26,6 +32,256 @@ from src.utils.logger import get_logger
 # ロガーを取得
 logger = get_logger(__name__)
 
+# 自動保存の間隔（ミリ秒）。変更がない間は段階的に間隔を延ばします
+AUTO_SAVE_INTERVALS_MS = (60000, 120000, 300000)
+
+# 添付ファイル選択ダイアログのファイル種別（全ウィンドウで共有）
+ATTACHMENT_FILETYPES = (
+    ("すべてのファイル", "*.*"),
+    ("文書ファイル", "*.pdf *.doc *.docx *.txt"),
+    ("画像ファイル", "*.jpg *.jpeg *.png *.gif *.bmp"),
+    ("表計算ファイル", "*.xls *.xlsx *.csv"),
+    ("圧縮ファイル", "*.zip *.rar *.7z")
+)
+
+# HTML→テキスト変換用のトークン（タグ / テキスト / 単独の'<'）
+_HTML_TOKEN = re.compile(r'<[a-zA-Z/!][^<>]*>|[^<]+|<')
+_HTML_TAG_NAME = re.compile(r'<\s*(/?)\s*([a-zA-Z][a-zA-Z0-9]*)')
+_HTML_BLOCK_TAGS = frozenset({'p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+_HTML_SKIP_TAGS = frozenset({'script', 'style'})
+_EXTRA_BLANK_LINES = re.compile(r'\n\s*\n\s*\n')
+
+# 本文をテキストウィジェットから読み出す際の1回あたりの行数
+BODY_CHUNK_LINES = 1024
+
+# ウィンドウ表示に失敗した際のエラーメッセージ
+_ERR_TEMPLATE = "メール作成ウィンドウの表示に失敗しました:\n{}"
+
+# 宛先の前後から除去する空白（全角スペースを含む明示的な文字集合）
+_ADDR_TRIM_CHARS = ' \t\r\n\u3000'
+
+# 宛先欄の区切り（カンマ前後の空白・連続カンマを分割時にまとめて除去）
+_ADDR_SPLIT = re.compile(f'[{_ADDR_TRIM_CHARS},]*,[{_ADDR_TRIM_CHARS},]*')
+
+
+def _split_addresses(raw: str) -> List[str]:
+    """
+    カンマ区切りの宛先文字列をアドレスのリストに分割します
+    
+    Args:
+        raw: 宛先欄の入力値
+        
+    Returns:
+        List[str]: 空要素を除いたアドレスリスト
+    """
+    raw = raw.strip(_ADDR_TRIM_CHARS)
+    if not raw:
+        return []
+    return [addr for addr in _ADDR_SPLIT.split(raw) if addr]
+
+
+def _entry_has_content(entry) -> bool:
+    """
+    入力欄に空白以外の内容があるかチェックします
+    
+    文字数が0の入力欄は文字列を取得せずに判定します。
+    
+    Args:
+        entry: 入力欄ウィジェット
+        
+    Returns:
+        bool: 空白以外の内容がある場合True
+    """
+    return int(entry.index("end")) > 0 and bool(entry.get().strip())
+
+
+def _text_has_content(widget: tk.Text) -> bool:
+    """
+    テキストウィジェットに空白以外の内容があるかチェックします
+    
+    本文を取得せず、文字数と空白以外の文字の検索だけで判定します。
+    
+    Args:
+        widget: テキストウィジェット
+        
+    Returns:
+        bool: 空白以外の内容がある場合True
+    """
+    if not widget.count("1.0", "end-1c", "chars"):
+        return False
+    return bool(widget.search(r"\S", "1.0", "end", regexp=True))
+
+
+def _iter_text_chunks(widget: tk.Text, lines_per_chunk: int = BODY_CHUNK_LINES) -> Iterator[str]:
+    """
+    テキストウィジェットの内容を行単位のチャンクで順に取得します
+    
+    巨大な本文を1回の呼び出しで丸ごとコピーせず、
+    小さな文字列に分けてTclから受け取ります。
+    
+    Args:
+        widget: テキストウィジェット
+        lines_per_chunk: 1チャンクあたりの行数
+        
+    Yields:
+        str: 本文の一部（連結すると get("1.0", END) と同じ内容）
+    """
+    last_line = int(widget.index("end-1c").split(".")[0])
+    for start in range(1, last_line + 1, lines_per_chunk):
+        yield widget.get(f"{start}.0", f"{start + lines_per_chunk}.0")
+
+
+@dataclass(slots=True)
+class ComposeSnapshot:
+    """
+    メール作成フォームの入力内容のスナップショット
+    
+    検証・メッセージ作成で各ウィジェットの値を一度だけ取得するために使用します。
+    
+    Attributes:
+        subject: 件名（前後の空白除去済み）
+        to_raw: 宛先欄の入力値
+        cc_raw: CC欄の入力値
+        bcc_raw: BCC欄の入力値
+        is_html: HTML編集モードかどうか
+        body_widget: 本文を入力するテキストウィジェット
+        body: 本文（前後の空白除去済み、HTMLモードではHTMLソース）。
+            必要になるまで取得しません
+    """
+    subject: str
+    to_raw: str
+    cc_raw: str
+    bcc_raw: str
+    is_html: bool
+    body_widget: tk.Text
+    body: Optional[str] = None
+    
+    def get_body(self) -> str:
+        """
+        本文を取得します（ウィジェットからの読み込みは初回のみ）
+        
+        Returns:
+            str: 本文
+        """
+        if self.body is None:
+            self.body = "".join(_iter_text_chunks(self.body_widget)).strip()
+        return self.body
+    
+    def is_body_empty(self) -> bool:
+        """
+        本文が空かどうかを判定します
+        
+        文字数が0の場合は本文をコピーせずに判定します。
+        
+        Returns:
+            bool: 本文が空（空白のみを含む）の場合True
+        """
+        if self.body is None and not self.body_widget.count("1.0", "end-1c", "chars"):
+            return True
+        return not self.get_body()
+
+
+class _ValidationDialog(tk.Toplevel):
+    """
+    送信前の確認ダイアログ
+    
+    件名・本文が空の場合の警告を1つのダイアログにまとめて表示します。
+    一度作成したダイアログは破棄せず、表示・非表示を切り替えて再利用します。
+    """
+    
+    def __init__(self, parent):
+        """
+        確認ダイアログを初期化します
+        
+        Args:
+            parent: 親ウィンドウ（メール作成ウィンドウ）
+        """
+        super().__init__(parent)
+        self.withdraw()
+        self.title("確認")
+        self.transient(parent)
+        self.resizable(False, False)
+        
+        self._answer = False
+        self._answered = tk.BooleanVar(master=self, value=False)
+        
+        content = ttk.Frame(self, padding=16)
+        content.pack(fill=tk.BOTH, expand=True)
+        
+        # 警告行（必要な行のみ表示）
+        self.subject_warning = ttk.Label(content, text="• 件名が空です。")
+        self.subject_warning.grid(row=0, column=0, columnspan=2, sticky=tk.W)
+        self.body_warning = ttk.Label(content, text="• 本文が空です。")
+        self.body_warning.grid(row=1, column=0, columnspan=2, sticky=tk.W)
+        
+        ttk.Label(content, text="このまま送信しますか？").grid(
+            row=2, column=0, columnspan=2, sticky=tk.W, pady=(8, 12)
+        )
+        
+        self.yes_button = ttk.Button(content, text="はい", command=lambda: self._close(True))
+        self.yes_button.grid(row=3, column=0, sticky=tk.E, padx=(0, 4))
+        ttk.Button(content, text="いいえ", command=lambda: self._close(False)).grid(
+            row=3, column=1, sticky=tk.W, padx=(4, 0)
+        )
+        
+        self.protocol("WM_DELETE_WINDOW", lambda: self._close(False))
+        self.bind("<Return>", lambda e: self._close(True))
+        self.bind("<Escape>", lambda e: self._close(False))
+        
+        # 親ウィンドウごと破棄された場合も待機を解除
+        self.bind("<Destroy>", self._on_destroy)
+    
+    def ask(self, subject_empty: bool, body_empty: bool) -> bool:
+        """
+        ダイアログを表示し、応答を待ちます
+        
+        Args:
+            subject_empty: 件名が空かどうか
+            body_empty: 本文が空かどうか
+            
+        Returns:
+            bool: 「はい」が選択された場合True
+        """
+        for label, visible in ((self.subject_warning, subject_empty),
+                               (self.body_warning, body_empty)):
+            if visible:
+                label.grid()
+            else:
+                label.grid_remove()
+        
+        self._answer = False
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+        self.yes_button.focus_set()
+        
+        # 応答があるまで待機（イベントループは継続）
+        self.wait_variable(self._answered)
+        return self._answer
+    
+    def _close(self, answer: bool):
+        """
+        応答を記録してダイアログを隠します
+        
+        Args:
+            answer: 応答（はい: True）
+        """
+        self._answer = answer
+        self.grab_release()
+        self.withdraw()
+        
+        # 親ウィンドウのモーダル状態を戻す
+        self.master.grab_set()
+        self._answered.set(answer)
+    
+    def _on_destroy(self, event):
+        """
+        ダイアログ破棄イベント
+        """
+        if event.widget is self:
+            self._answer = False
+            self._answered.set(False)
+
 
 class ComposeWindow:
     """
@@ -75,12 +331,32 @@ class ComposeWindow:
         self.original_message = original_message
         self.on_sent = on_sent
         
+        # ウィンドウの存続中は変わらない値を事前に作成
+        self._sender_str = f"{account.name} <{account.email_address}>"
+        self._mk_message = functools.partial(
+            MailMessage,
+            sender=self._sender_str,
+            account_id=account.account_id
+        )
+        self._reply_references: tuple = ()
+        if original_message and message_type == "reply":
+            self._reply_references = tuple(original_message.references) + (original_message.message_id,)
+        
         # ウィンドウ状態
         self.window = None
         self.is_html_mode = tk.BooleanVar(value=False)
+        self._html_mode_active = False  # is_html_mode の値（Tcl変数を毎回読まないため）
+        # 送信メッセージとリストを共有するため、追加・削除時は新しいリストに差し替える
         self.attachments: List[MailAttachment] = []
         self.is_draft_saved = False
         self.auto_save_timer = None
+        self._dirty = False
+        self._auto_save_step = 0
+        self._last_sent_message: Optional[MailMessage] = None
+        self._val_dialog: Optional[_ValidationDialog] = None
+        
+        # 送信等のバックグラウンド処理用スレッドプール
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="compose-io")
         
         # UI要素の参照
         self.to_entry = None
@@ -175,6 +451,9 @@ class ComposeWindow:
         # キーバインド設定
         self._setup_key_bindings()
         
+        # 変更検知を設定
+        self._setup_change_tracking()
+        
         # 自動保存タイマー開始
         self._start_auto_save()
         
@@ -244,6 +523,9 @@ class ComposeWindow:
     def _create_header_section(self):
         """
         ヘッダーセクション（宛先、件名等）を作成します
+        
+        行ごとのフレームを入れ子にせず、1つのフレーム上にgridで配置することで
+        ウィジェット数とジオメトリ計算の回数を抑えます。
         """
         header_frame = ttk.LabelFrame(
             self.window,
@@ -251,103 +533,89 @@ class ComposeWindow:
             style="Header.Wabi.TLabelframe"
         )
         header_frame.pack(fill=tk.X, padx=8, pady=4)
+        header_frame.columnconfigure(1, weight=1)
         
         # 送信者情報
-        from_frame = ttk.Frame(header_frame)
-        from_frame.pack(fill=tk.X, padx=8, pady=4)
-        
-        ttk.Label(
-            from_frame,
-            text="差出人:",
-            style="HeaderLabel.Wabi.TLabel",
-            width=8
-        ).pack(side=tk.LEFT)
+        self._create_header_label(header_frame, "差出人:", row=0, pady=4)
         
         from_info = ttk.Label(
-            from_frame,
-            text=f"{self.account.name} <{self.account.email_address}>",
+            header_frame,
+            text=self._sender_str,
             style="HeaderValue.Wabi.TLabel"
         )
-        from_info.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        from_info.grid(row=0, column=1, columnspan=2, sticky=tk.EW, padx=(0, 8), pady=4)
         
         # 宛先
-        to_frame = ttk.Frame(header_frame)
-        to_frame.pack(fill=tk.X, padx=8, pady=2)
-        
-        ttk.Label(
-            to_frame,
-            text="宛先:",
-            style="HeaderLabel.Wabi.TLabel",
-            width=8
-        ).pack(side=tk.LEFT)
-        
-        self.to_entry = ttk.Entry(
-            to_frame,
-            style="HeaderEntry.Wabi.TEntry",
-            font=self.wabi_fonts["body"]
-        )
-        self.to_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 0))
+        self._create_header_label(header_frame, "宛先:", row=1, pady=2)
+        self.to_entry = self._create_header_entry(header_frame, row=1, pady=2, columnspan=1)
         
         # CC/BCC展開ボタン
         cc_button = ttk.Button(
-            to_frame,
+            header_frame,
             text="CC/BCC",
             style="CCButton.Wabi.TButton",
             command=self._toggle_cc_bcc
         )
-        cc_button.pack(side=tk.RIGHT, padx=(4, 0))
-        
-        # CC（最初は非表示）
-        self.cc_frame = ttk.Frame(header_frame)
-        
-        ttk.Label(
-            self.cc_frame,
-            text="CC:",
-            style="HeaderLabel.Wabi.TLabel",
-            width=8
-        ).pack(side=tk.LEFT)
-        
-        self.cc_entry = ttk.Entry(
-            self.cc_frame,
-            style="HeaderEntry.Wabi.TEntry",
-            font=self.wabi_fonts["body"]
-        )
-        self.cc_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 0))
+        cc_button.grid(row=1, column=2, padx=(4, 8), pady=2)
         
-        # BCC（最初は非表示）
-        self.bcc_frame = ttk.Frame(header_frame)
+        # CC・BCC（最初は非表示）
+        cc_label = self._create_header_label(header_frame, "CC:", row=2, pady=2)
+        self.cc_entry = self._create_header_entry(header_frame, row=2, pady=2)
+        bcc_label = self._create_header_label(header_frame, "BCC:", row=3, pady=2)
+        self.bcc_entry = self._create_header_entry(header_frame, row=3, pady=2)
         
-        ttk.Label(
-            self.bcc_frame,
-            text="BCC:",
-            style="HeaderLabel.Wabi.TLabel",
-            width=8
-        ).pack(side=tk.LEFT)
-        
-        self.bcc_entry = ttk.Entry(
-            self.bcc_frame,
-            style="HeaderEntry.Wabi.TEntry",
-            font=self.wabi_fonts["body"]
-        )
-        self.bcc_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 0))
+        self._cc_bcc_widgets = (cc_label, self.cc_entry, bcc_label, self.bcc_entry)
+        for widget in self._cc_bcc_widgets:
+            widget.grid_remove()
         
         # 件名
-        subject_frame = ttk.Frame(header_frame)
-        subject_frame.pack(fill=tk.X, padx=8, pady=4)
+        self._create_header_label(header_frame, "件名:", row=4, pady=4)
+        self.subject_entry = self._create_header_entry(header_frame, row=4, pady=4)
+    
+    def _create_header_label(self, parent, text: str, row: int, pady: int) -> ttk.Label:
+        """
+        ヘッダー行の見出しラベルを作成します
         
-        ttk.Label(
-            subject_frame,
-            text="件名:",
+        Args:
+            parent: 親ウィジェット
+            text: ラベル文字列
+            row: 配置する行
+            pady: 縦方向の余白
+            
+        Returns:
+            ttk.Label: 作成されたラベル
+        """
+        label = ttk.Label(
+            parent,
+            text=text,
             style="HeaderLabel.Wabi.TLabel",
             width=8
-        ).pack(side=tk.LEFT)
+        )
+        label.grid(row=row, column=0, sticky=tk.W, padx=(8, 0), pady=pady)
+        return label
+    
+    def _create_header_entry(self, parent, row: int, pady: int,
+                             columnspan: int = 2) -> ttk.Entry:
+        """
+        ヘッダー行の入力欄を作成します
         
-        self.subject_entry = ttk.Entry(
-            subject_frame,
+        Args:
+            parent: 親ウィジェット
+            row: 配置する行
+            pady: 縦方向の余白
+            columnspan: 占有するカラム数
+            
+        Returns:
+            ttk.Entry: 作成された入力欄
+        """
+        entry = ttk.Entry(
+            parent,
             style="HeaderEntry.Wabi.TEntry",
             font=self.wabi_fonts["body"]
         )
-        self.subject_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(4, 0))
+        entry.grid(row=row, column=1, columnspan=columnspan, sticky=tk.EW,
+                   padx=(4, 8 if columnspan > 1 else 0), pady=pady)
+        return entry
     
     def _create_body_section(self):
         """
@@ -567,31 +835,38 @@ class ComposeWindow:
 {message.body_text or '[本文なし]'}
 """
         
-        if message.has_attachments():
-            forward_text += f"\n\n添付ファイル: {message.get_attachment_count()}件"
-            for attachment in message.attachments:
-                forward_text += f"\n• {attachment.filename} ({attachment.size:,}バイト)"
+        if not message.has_attachments():
+            return forward_text
+        
+        # 添付ファイル一覧は部品をまとめて一度だけ連結
+        parts = [forward_text, f"\n\n添付ファイル: {message.get_attachment_count()}件"]
+        parts.extend(
+            f"\n• {attachment.filename} ({attachment.size:,}バイト)"
+            for attachment in message.attachments
+        )
         
-        return forward_text
+        return ''.join(parts)
     
     def _toggle_cc_bcc(self):
         """
         CC/BCC欄の表示切り替え
         """
-        if self.cc_frame.winfo_manager():
-            # 非表示にする
-            self.cc_frame.pack_forget()
-            self.bcc_frame.pack_forget()
+        if self.cc_entry.winfo_manager():
+            # 非表示にする（grid設定は保持）
+            for widget in self._cc_bcc_widgets:
+                widget.grid_remove()
         else:
             # 表示する
-            self.cc_frame.pack(fill=tk.X, padx=8, pady=2, after=self.to_entry.master)
-            self.bcc_frame.pack(fill=tk.X, padx=8, pady=2, after=self.cc_frame)
+            for widget in self._cc_bcc_widgets:
+                widget.grid()
     
     def _toggle_html_mode(self):
         """
         HTML/テキスト編集モードの切り替え
         """
-        if self.is_html_mode.get():
+        self._html_mode_active = self.is_html_mode.get()
+        
+        if self._html_mode_active:
             # HTMLモードに切り替え
             # テキストエリアの内容をHTMLエディタに移行
             text_content = self.body_text.get("1.0", tk.END)
@@ -631,8 +906,6 @@ class ComposeWindow:
         Returns:
             str: HTML形式のテキスト
         """
-        import html
-        
         # HTMLエスケープ
         escaped_text = html.escape(text)
         
@@ -666,41 +939,70 @@ class ComposeWindow:
         """
         HTMLをプレーンテキストに変換します
         
+        DOMを構築せず、タグとテキストのトークンを先頭から1回だけ走査します。
+        <br>と段落・見出しの終了タグは改行に置き換え、
+        <script>/<style>の内容は出力しません。
+        
         Args:
             html_content: HTMLコンテンツ
             
         Returns:
             str: プレーンテキスト
         """
-        import re
-        import html
+        parts = []
+        skip_tag = None
+        after_break = False
         
-        # HTMLタグを除去
-        text = re.sub(r'<[^>]+>', '', html_content)
+        for match in _HTML_TOKEN.finditer(html_content):
+            token = match.group()
+            
+            if len(token) > 1 and token[0] == '<':
+                # タグ（DOCTYPE・コメント等は名前が取れないので無視）
+                tag_match = _HTML_TAG_NAME.match(token)
+                if not tag_match:
+                    continue
+                
+                is_closing = bool(tag_match.group(1))
+                tag_name = tag_match.group(2).lower()
+                
+                if skip_tag:
+                    if is_closing and tag_name == skip_tag:
+                        skip_tag = None
+                    continue
+                
+                if not is_closing and tag_name in _HTML_SKIP_TAGS:
+                    skip_tag = tag_name
+                elif tag_name == 'br' or (is_closing and tag_name in _HTML_BLOCK_TAGS):
+                    parts.append('\n')
+                    after_break = True
+                continue
+            
+            if skip_tag:
+                continue
+            
+            # 改行タグ直後のソース上の改行は重複させない
+            if after_break and token[0] == '\n':
+                token = token[1:]
+            after_break = False
+            parts.append(token)
         
         # HTMLエンティティをデコード
-        text = html.unescape(text)
+        text = html.unescape(''.join(parts))
         
         # 余分な空白を整理
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
-        text = text.strip()
-        
-        return text
+        text = _EXTRA_BLANK_LINES.sub('\n\n', text)
+        return text.strip()
     
     def _add_attachment(self):
         """
         添付ファイルを追加します
         """
+        from tkinter import messagebox
+        
         file_path = filedialog.askopenfilename(
             title="添付ファイルを選択",
             parent=self.window,
-            filetypes=[
-                ("すべてのファイル", "*.*"),
-                ("文書ファイル", "*.pdf *.doc *.docx *.txt"),
-                ("画像ファイル", "*.jpg *.jpeg *.png *.gif *.bmp"),
-                ("表計算ファイル", "*.xls *.xlsx *.csv"),
-                ("圧縮ファイル", "*.zip *.rar *.7z")
-            ]
+            filetypes=ATTACHMENT_FILETYPES
         )
         
         if file_path:
@@ -710,7 +1012,6 @@ class ComposeWindow:
                 file_size = file_path_obj.stat().st_size
                 
                 # MIMEタイプを推測
-                import mimetypes
                 content_type, _ = mimetypes.guess_type(file_path)
                 if not content_type:
                     content_type = "application/octet-stream"
@@ -726,8 +1027,9 @@ class ComposeWindow:
                 with open(file_path, 'rb') as f:
                     attachment.data = f.read()
                 
-                # 添付ファイルリストに追加
-                self.attachments.append(attachment)
+                # 添付ファイルリストに追加（作成済みメッセージと共有しないよう差し替え）
+                self.attachments = self.attachments + [attachment]
+                self._dirty = True
                 
                 # 表示を更新
                 self._update_attachments_display()
@@ -759,6 +1061,12 @@ class ComposeWindow:
         # 添付ファイルセクションを表示
         self.attachments_frame.pack(fill=tk.X, padx=8, pady=4, before=self.status_label.master)
         
+        # 件数・合計サイズ（サイズ列だけを取り出して集計）
+        total_size = sum(map(operator.attrgetter("size"), self.attachments))
+        self.attachments_frame.config(
+            text=f"📎 添付ファイル ({len(self.attachments)}件, {self._format_file_size(total_size)})"
+        )
+        
         # 各添付ファイルを表示
         for i, attachment in enumerate(self.attachments):
             self._create_attachment_item(attachment, i)
@@ -854,7 +1162,9 @@ class ComposeWindow:
             index: 削除する添付ファイルのインデックス
         """
         if 0 <= index < len(self.attachments):
-            removed_attachment = self.attachments.pop(index)
+            removed_attachment = self.attachments[index]
+            self.attachments = self.attachments[:index] + self.attachments[index + 1:]
+            self._dirty = True
             self._update_attachments_display()
             self._update_status(f"📎 添付ファイルを削除しました: {removed_attachment.filename}")
             logger.info(f"添付ファイルを削除: {removed_attachment.filename}")
@@ -877,11 +1187,46 @@ class ComposeWindow:
         
         logger.debug("キーバインドを設定しました")
     
+    def _setup_change_tracking(self):
+        """
+        入力内容の変更検知を設定します
+        
+        自動保存は変更があった場合のみ実行されます。
+        返信・転送の初期データは変更として扱いません。
+        """
+        self._reset_modified_flags()
+        for text_widget in (self.body_text, self.html_editor):
+            text_widget.bind('<<Modified>>', self._on_text_modified)
+        
+        for entry in (self.to_entry, self.cc_entry, self.bcc_entry, self.subject_entry):
+            entry.bind('<KeyRelease>', self._mark_dirty, add='+')
+    
+    def _on_text_modified(self, event):
+        """
+        テキスト変更イベント
+        """
+        # <<Modified>>はフラグ変化時のみ発生し、フラグは下書き保存時にリセット
+        if event.widget.edit_modified():
+            self._dirty = True
+    
+    def _reset_modified_flags(self):
+        """
+        本文の変更フラグをリセットします
+        """
+        self.body_text.edit_modified(False)
+        self.html_editor.edit_modified(False)
+    
+    def _mark_dirty(self, event=None):
+        """
+        未保存の変更があることを記録します
+        """
+        self._dirty = True
+    
     def _update_char_count(self, event=None):
         """
         文字数カウンターを更新します
         """
-        if self.is_html_mode.get():
+        if self._html_mode_active:
             content = self.html_editor.get("1.0", tk.END)
         else:
             content = self.body_text.get("1.0", tk.END)
@@ -895,13 +1240,24 @@ class ComposeWindow:
         自動保存タイマーを開始します
         """
         def auto_save():
-            if self.window and self.window.winfo_exists():
+            if not (self.window and self.window.winfo_exists()):
+                return
+            
+            if self._dirty:
                 self._save_draft_silently()
-                # 5分後に再実行
-                self.auto_save_timer = self.window.after(300000, auto_save)  # 5分 = 300,000ms
+                self._auto_save_step = 0
+            else:
+                # 変更がない間は確認間隔を延ばす（1分 → 2分 → 5分）
+                self._auto_save_step = min(self._auto_save_step + 1,
+                                           len(AUTO_SAVE_INTERVALS_MS) - 1)
+            
+            self.auto_save_timer = self.window.after(
+                AUTO_SAVE_INTERVALS_MS[self._auto_save_step], auto_save
+            )
         
-        # 最初の自動保存は1分後
-        self.auto_save_timer = self.window.after(60000, auto_save)  # 1分 = 60,000ms
+        # 最初の確認は1分後
+        self._auto_save_step = 0
+        self.auto_save_timer = self.window.after(AUTO_SAVE_INTERVALS_MS[0], auto_save)
     
     def _save_draft_silently(self):
         """
@@ -915,6 +1271,8 @@ class ComposeWindow:
             # TODO: 下書きの永続化実装
             
             self.is_draft_saved = True
+            self._dirty = False
+            self._reset_modified_flags()
             logger.debug("下書きを自動保存しました")
             
         except Exception as e:
@@ -924,6 +1282,8 @@ class ComposeWindow:
         """
         下書きを保存します
         """
+        from tkinter import messagebox
+        
         try:
             self._save_draft_silently()
             self._update_status("💾 下書きを保存しました")
@@ -945,19 +1305,30 @@ class ComposeWindow:
         """
         メッセージを送信します
         """
+        from tkinter import messagebox
+        
         try:
+            # 入力内容を一度だけ取得
+            snapshot = self._snapshot_inputs()
+            
             # 入力検証
-            if not self._validate_message():
+            if not self._validate_message(snapshot):
                 return
             
             self._update_status("📮 メッセージを送信中...")
             
-            # メッセージデータを作成
-            message_data = self._create_message_data()
+            # メッセージデータを作成（送信完了コールバックでも再利用）
+            # HTML本文のテキスト変換は送信スレッドで行う
+            message_data = self._create_message_data(snapshot, convert_html=False)
+            message_data.date_sent = datetime.now()
+            self._last_sent_message = message_data
             
             # バックグラウンドで送信処理
             def send_in_background():
                 try:
+                    if message_data.body_html:
+                        message_data.body_text = self._html_to_text(message_data.body_html)
+                    
                     # SMTPクライアントを作成
                     smtp_client = MailClientFactory.create_send_client(self.account)
                     
@@ -971,10 +1342,11 @@ class ComposeWindow:
                     self.window.after(0, lambda: self._handle_send_result(success, result))
                     
                 except Exception as e:
-                    self.window.after(0, lambda: self._handle_send_error(str(e)))
+                    error_message = str(e)
+                    self.window.after(0, lambda: self._handle_send_error(error_message))
             
-            # バックグラウンドスレッドで送信実行
-            threading.Thread(target=send_in_background, daemon=True).start()
+            # スレッドプールで送信実行
+            self._io_pool.submit(send_in_background)
             
         except Exception as e:
             logger.error(f"メッセージ送信エラー: {e}")
@@ -984,16 +1356,42 @@ class ComposeWindow:
                 parent=self.window
             )
     
-    def _validate_message(self) -> bool:
+    def _snapshot_inputs(self) -> ComposeSnapshot:
+        """
+        フォームの入力内容を取得します
+        
+        Returns:
+            ComposeSnapshot: 入力内容のスナップショット
+        """
+        is_html = self._html_mode_active
+        body_widget = self.html_editor if is_html else self.body_text
+        
+        return ComposeSnapshot(
+            subject=self.subject_entry.get().strip(),
+            to_raw=self.to_entry.get(),
+            cc_raw=self.cc_entry.get(),
+            bcc_raw=self.bcc_entry.get(),
+            is_html=is_html,
+            body_widget=body_widget
+        )
+    
+    def _validate_message(self, snapshot: Optional[ComposeSnapshot] = None) -> bool:
         """
         メッセージの入力検証を行います
         
+        Args:
+            snapshot: 入力内容（省略時はフォームから取得）
+        
         Returns:
             bool: 検証成功時True
         """
+        from tkinter import messagebox
+        
+        if snapshot is None:
+            snapshot = self._snapshot_inputs()
+        
         # 宛先チェック
-        to_addresses = self.to_entry.get().strip()
-        if not to_addresses:
+        if not snapshot.to_raw.strip():
             messagebox.showerror(
                 "入力エラー",
                 "宛先を入力してください。",
@@ -1002,78 +1400,68 @@ class ComposeWindow:
             self.to_entry.focus()
             return False
         
-        # 件名チェック
-        subject = self.subject_entry.get().strip()
-        if not subject:
-            result = messagebox.askyesno(
-                "確認",
-                "件名が空です。このまま送信しますか？",
-                parent=self.window
-            )
-            if not result:
-                self.subject_entry.focus()
-                return False
-        
-        # 本文チェック
-        if self.is_html_mode.get():
-            body = self.html_editor.get("1.0", tk.END).strip()
-        else:
-            body = self.body_text.get("1.0", tk.END).strip()
+        # 件名・本文チェック（警告は1つのダイアログにまとめて確認）
+        subject_empty = not snapshot.subject
+        body_empty = snapshot.is_body_empty()
         
-        if not body:
-            result = messagebox.askyesno(
-                "確認",
-                "本文が空です。このまま送信しますか？",
-                parent=self.window
-            )
-            if not result:
-                if self.is_html_mode.get():
-                    self.html_editor.focus()
+        if subject_empty or body_empty:
+            if self._val_dialog is None:
+                self._val_dialog = _ValidationDialog(self.window)
+            
+            if not self._val_dialog.ask(subject_empty, body_empty):
+                if subject_empty:
+                    self.subject_entry.focus()
                 else:
-                    self.body_text.focus()
+                    snapshot.body_widget.focus()
                 return False
         
         return True
     
-    def _create_message_data(self) -> MailMessage:
+    def _create_message_data(self, snapshot: Optional[ComposeSnapshot] = None,
+                             convert_html: bool = True) -> MailMessage:
         """
         メッセージデータを作成します
         
+        Args:
+            snapshot: 入力内容（省略時はフォームから取得）
+            convert_html: HTML本文からテキスト本文を作成するか
+                （Falseの場合は呼び出し側で変換する）
+        
         Returns:
             MailMessage: 作成されたメッセージ
         """
+        if snapshot is None:
+            snapshot = self._snapshot_inputs()
+        
         # 宛先情報を解析
-        to_addresses = [addr.strip() for addr in self.to_entry.get().split(',') if addr.strip()]
-        cc_addresses = [addr.strip() for addr in self.cc_entry.get().split(',') if addr.strip()] if self.cc_entry.get().strip() else []
-        bcc_addresses = [addr.strip() for addr in self.bcc_entry.get().split(',') if addr.strip()] if self.bcc_entry.get().strip() else []
+        to_addresses = _split_addresses(snapshot.to_raw)
+        cc_addresses = _split_addresses(snapshot.cc_raw)
+        bcc_addresses = _split_addresses(snapshot.bcc_raw)
         
         # 本文を取得
-        if self.is_html_mode.get():
-            body_html = self.html_editor.get("1.0", tk.END).strip()
-            body_text = self._html_to_text(body_html)
+        if snapshot.is_html:
+            body_html = snapshot.get_body()
+            body_text = self._html_to_text(body_html) if convert_html else ""
         else:
-            body_text = self.body_text.get("1.0", tk.END).strip()
+            body_text = snapshot.get_body()
             body_html = ""
         
-        # メッセージオブジェクトを作成
-        message = MailMessage(
-            subject=self.subject_entry.get().strip(),
-            sender=f"{self.account.name} <{self.account.email_address}>",
+        # メッセージオブジェクトを作成（差出人・アカウントIDは固定済み）
+        message = self._mk_message(
+            subject=snapshot.subject,
             recipients=to_addresses,
             cc_recipients=cc_addresses,
             bcc_recipients=bcc_addresses,
             body_text=body_text,
             body_html=body_html,
-            attachments=self.attachments.copy(),
-            account_id=self.account.account_id,
-            date_sent=datetime.now()
+            attachments=self.attachments
         )
         
         # 返信・転送の場合は関連情報を設定
         if self.original_message:
             if self.message_type == "reply":
                 message.in_reply_to = self.original_message.message_id
-                message.references = self.original_message.references + [self.original_message.message_id]
+                message.references = list(self._reply_references)
             elif self.message_type == "forward":
                 message.references = [self.original_message.message_id]
         
@@ -1087,6 +1475,8 @@ class ComposeWindow:
             success: 送信成功フラグ
             result: 結果メッセージ
         """
+        from tkinter import messagebox
+        
         if success:
             self._update_status("✅ メッセージを送信しました")
             
@@ -1097,16 +1487,16 @@ class ComposeWindow:
                 parent=self.window
             )
             
-            # コールバック実行
+            # コールバック実行（送信時に作成したメッセージを再利用）
             if self.on_sent:
                 try:
-                    message_data = self._create_message_data()
+                    message_data = self._last_sent_message or self._create_message_data()
                     self.on_sent(message_data)
                 except Exception as e:
                     logger.warning(f"送信コールバックエラー: {e}")
             
             # ウィンドウを閉じる
-            self.window.destroy()
+            self._close_window()
             
             logger.info("メッセージ送信完了")
             
@@ -1120,6 +1510,8 @@ class ComposeWindow:
         Args:
             error_message: エラーメッセージ
         """
+        from tkinter import messagebox
+        
         self._update_status("❌ メッセージ送信に失敗しました")
         
         logger.error(f"メッセージ送信エラー: {error_message}")
@@ -1135,6 +1527,8 @@ class ComposeWindow:
         """
         メール作成をキャンセルします
         """
+        from tkinter import messagebox
+        
         # 内容が変更されている場合は確認
         if self._has_unsaved_changes():
             result = messagebox.askyesnocancel(
@@ -1149,8 +1543,11 @@ class ComposeWindow:
             elif result:  # はい（保存）
                 self._save_draft()
         
+        # 添付ファイルを保持し続けないよう参照を解放
+        self._last_sent_message = None
+        
         # ウィンドウを閉じる
-        self.window.destroy()
+        self._close_window()
         logger.info("メール作成をキャンセルしました")
     
     def _has_unsaved_changes(self) -> bool:
@@ -1160,13 +1557,24 @@ class ComposeWindow:
         Returns:
             bool: 未保存の変更がある場合True
         """
-        # 基本的な内容チェック
-        has_to = bool(self.to_entry.get().strip())
-        has_subject = bool(self.subject_entry.get().strip())
-        has_body = bool(self.body_text.get("1.0", tk.END).strip())
-        has_attachments = bool(self.attachments)
-        
-        return has_to or has_subject or has_body or has_attachments
+        # 安価なチェックから順に評価し、変更が見つかった時点で終了
+        # （本文は全文を取得せず、内容があるかだけを判定する。
+        #   下書きはまだ永続化されないため、自動保存済みでも内容があれば確認する）
+        body_widget = self.html_editor if self._html_mode_active else self.body_text
+        return (
+            bool(self.attachments)
+            or _entry_has_content(self.to_entry)
+            or _entry_has_content(self.subject_entry)
+            or _text_has_content(body_widget)
+        )
+    
+    def _close_window(self):
+        """
+        ウィンドウを閉じ、スレッドプールを解放します
+        """
+        # 実行中の送信は完了させ、待機中のタスクは破棄
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self.window.destroy()
     
     def _on_window_close(self):
         """
@@ -1204,21 +1612,15 @@ def show_compose_window(parent, account: Account,
         ComposeWindow: 作成されたウィンドウインスタンス
     """
     try:
-        compose_window = ComposeWindow(
+        return ComposeWindow(
             parent=parent,
             account=account,
             message_type=message_type,
             original_message=original_message,
             on_sent=on_sent
         )
-        
-        return compose_window
-        
     except Exception as e:
         logger.error(f"メール作成ウィンドウ表示エラー: {e}")
-        messagebox.showerror(
-            "エラー",
-            f"メール作成ウィンドウの表示に失敗しました:\n{e}",
-            parent=parent
-        )
-        return None
\ No newline at end of file
+        from tkinter import messagebox
+        messagebox.showerror("エラー", _ERR_TEMPLATE.format(e), parent=parent)
+        return None
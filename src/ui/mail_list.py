@@ -14,8 +14,14 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Optional, Dict, Any, Callable
 import threading
+import time
+import math
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from operator import attrgetter
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
 from src.mail.mail_message import MailMessage, MessageFlag
@@ -24,6 +30,39 @@ from src.utils.logger import get_logger
 # ロガーを取得
 logger = get_logger(__name__)
 
+# 表示範囲の下端がこの位置を超えたら次のページを描画する（スクロール位置 0.0〜1.0）
+SCROLL_PRELOAD_THRESHOLD = 0.9
+
+# 1ページの行数（Treeviewに表示できる行数 × この値。表示範囲の先読み分を含む）
+PAGE_VIEWPORTS = 2
+
+# 1ページの最小行数
+MIN_PAGE_ROWS = 50
+
+# テーマから行の高さを取得できない場合の値（ピクセル）
+DEFAULT_ROW_HEIGHT = 20
+
+# イベントの state に含まれるShiftキーのビット
+_SHIFT_MASK = 0x0001
+
+# メッセージ状態のビット（_flag_bits の戻り値）
+_FLAG_READ = 1
+_FLAG_FLAGGED = 2
+_FLAG_ATTACHMENT = 4
+
+# 状態ビットごとのフラグアイコンと行タグ（0〜7で引く）
+_FLAG_GLYPHS = tuple(
+    ("📖" if bits & _FLAG_READ else "📩")
+    + ("⭐" if bits & _FLAG_FLAGGED else "")
+    + ("📎" if bits & _FLAG_ATTACHMENT else "")
+    for bits in range(8)
+)
+_FLAG_TAGS = tuple(
+    (() if bits & _FLAG_READ else ("unread",))
+    + (("flagged",) if bits & _FLAG_FLAGGED else ())
+    for bits in range(8)
+)
+
 
 class SortColumn(Enum):
     """ソート可能なカラム"""
@@ -40,6 +79,115 @@ class SortOrder(Enum):
     DESCENDING = "desc"
 
 
+@dataclass(slots=True)
+class _DisplayCache:
+    """
+    メッセージ表示・ソート・フィルター用の計算済みフィールド
+    
+    メッセージ本体に `_display_cache` 属性として保持し、
+    メッセージが更新されたら `_invalidate_display_cache` で破棄します。
+    """
+    sender_lc: str
+    subject_lc: str
+    size: int
+    size_str: str
+    date_key: float  # ソート用のエポック秒（タイムゾーン有無の混在でも比較できる）
+    date_str: str
+    searchable_lc: Optional[str] = None  # 検索時に初めて作成（本文を含むため）
+
+
+def _flag_bits(message: MailMessage) -> int:
+    """
+    メッセージの既読・重要・添付の状態を1つの整数にまとめます
+    
+    フラグはその場で変更されるため、キャッシュせず毎回求めます。
+    
+    Args:
+        message: 対象メッセージ
+        
+    Returns:
+        int: _FLAG_READ / _FLAG_FLAGGED / _FLAG_ATTACHMENT の組み合わせ
+    """
+    flags = message.flags
+    return ((MessageFlag.SEEN in flags)
+            | ((MessageFlag.FLAGGED in flags) << 1)
+            | (bool(message.attachments) << 2))
+
+
+def _format_size(size: int) -> str:
+    """
+    サイズを表示用の文字列にします
+    
+    Args:
+        size: バイト数
+        
+    Returns:
+        str: "512B" / "12KB" / "3MB" 形式の文字列
+    """
+    if size < 1024:
+        return f"{size}B"
+    elif size < 1024 * 1024:
+        return f"{size//1024}KB"
+    else:
+        return f"{size//(1024*1024)}MB"
+
+
+def _display_cache(message: MailMessage) -> _DisplayCache:
+    """
+    メッセージの表示用キャッシュを取得します（なければ作成）
+    
+    Args:
+        message: 対象メッセージ
+        
+    Returns:
+        _DisplayCache: 表示用キャッシュ
+    """
+    cache = getattr(message, "_display_cache", None)
+    if cache is None:
+        date = message.get_display_date()
+        try:
+            date_key = date.timestamp()
+        except (OverflowError, OSError, ValueError):
+            date_key = 0.0
+        size = len(message.body_text) + len(message.body_html)
+        cache = _DisplayCache(
+            sender_lc=message.sender.lower(),
+            subject_lc=message.subject.lower(),
+            size=size,
+            size_str=_format_size(size),
+            date_key=date_key,
+            date_str=date.strftime("%m/%d %H:%M"),
+        )
+        message._display_cache = cache
+    return cache
+
+
+def _searchable_text(message: MailMessage) -> str:
+    """
+    検索対象の小文字テキスト（送信者・件名・本文）を取得します
+    
+    Args:
+        message: 対象メッセージ
+        
+    Returns:
+        str: 検索用テキスト
+    """
+    cache = _display_cache(message)
+    if cache.searchable_lc is None:
+        cache.searchable_lc = f"{cache.sender_lc} {cache.subject_lc} {message.body_text.lower()}"
+    return cache.searchable_lc
+
+
+def _invalidate_display_cache(message: MailMessage):
+    """
+    メッセージの表示用キャッシュを破棄します
+    
+    Args:
+        message: 対象メッセージ
+    """
+    message.__dict__.pop("_display_cache", None)
+
+
 @dataclass
 class MailListFilter:
     """メールリストフィルター設定"""
@@ -52,6 +200,221 @@ class MailListFilter:
     subject_filter: str = ""
 
 
+def _match_search(messages: List[MailMessage], query: str,
+                  search_cache: Optional[tuple]) -> tuple:
+    """
+    検索クエリに一致するメッセージを求めます
+    
+    前回のクエリを含むクエリ（入力の続き）であれば、
+    前回一致したメッセージだけを対象に検索します。
+    
+    Args:
+        messages: 全メッセージ
+        query: 小文字化済みの検索クエリ
+        search_cache: 前回の (検索クエリ, 一致したメッセージのid()集合)、なければNone
+    
+    Returns:
+        tuple: (一致したメッセージの id() の集合, 次回用の検索キャッシュ)
+    """
+    candidates = messages
+    if search_cache is not None:
+        last_query, last_matches = search_cache
+        if last_query == query:
+            return last_matches, search_cache
+        if last_query in query:
+            candidates = [m for m in messages if id(m) in last_matches]
+    
+    matches = {id(m) for m in candidates if query in _searchable_text(m)}
+    return matches, (query, matches)
+
+
+# ソートカラムごとのソートキー（フラグ順は 未読=2 + 重要=1 の整数で比較）
+_SORT_KEYS = {
+    SortColumn.DATE: attrgetter("_display_cache.date_key"),
+    SortColumn.SENDER: attrgetter("_display_cache.sender_lc"),
+    SortColumn.SUBJECT: attrgetter("_display_cache.subject_lc"),
+    SortColumn.SIZE: attrgetter("_display_cache.size"),
+    SortColumn.FLAGS: lambda msg: (not msg.is_read()) << 1 | msg.is_flagged(),
+}
+
+
+def _sort_key(message: MailMessage, column: 'SortColumn'):
+    """
+    1件のメッセージのソートキーを取得します
+    
+    Args:
+        message: 対象メッセージ
+        column: ソートカラム
+        
+    Returns:
+        ソートキー
+    """
+    _display_cache(message)
+    return _SORT_KEYS[column](message)
+
+
+def _sort_messages(messages: List[MailMessage], column: 'SortColumn', order: 'SortOrder'):
+    """
+    メッセージリストをその場でソートします
+    
+    Args:
+        messages: ソートするメッセージリスト
+        column: ソートカラム
+        order: ソート順序
+    """
+    key = _SORT_KEYS[column]
+    reverse = (order == SortOrder.DESCENDING)
+    
+    try:
+        messages.sort(key=key, reverse=reverse)
+    except AttributeError:
+        # 表示用キャッシュのないメッセージがあれば作成してから並べ替える
+        # （キーはすべて求めてから並べ替えるため、失敗時のリストは元のまま）
+        for message in messages:
+            _display_cache(message)
+        messages.sort(key=key, reverse=reverse)
+
+
+def _compute_filtered(messages: List[MailMessage], settings: MailListFilter, search_query: str,
+                      sort_column: 'SortColumn', sort_order: 'SortOrder',
+                      search_cache: Optional[tuple]) -> tuple:
+    """
+    フィルターとソートを適用したメッセージリストを作成します
+    
+    ウィジェットに触れないため、ワーカースレッドからも呼び出せます。
+    
+    Args:
+        messages: 全メッセージ
+        settings: フィルター設定
+        search_query: 小文字化済みの検索クエリ
+        sort_column: ソートカラム
+        sort_order: ソート順序
+        search_cache: 前回の検索キャッシュ
+    
+    Returns:
+        tuple: (フィルター・ソート後のメッセージリスト, 次回用の検索キャッシュ)
+    """
+    # 比較用の小文字化はループの外で一度だけ行う
+    sender_query = settings.sender_filter.lower()
+    subject_query = settings.subject_filter.lower()
+    
+    # 有効な条件ごとに1回ずつ絞り込む（安価なフラグ条件を先に適用し、
+    # 高価な文字列検索は残った候補だけに対して行う）。
+    # 条件が何もなければ各メッセージには触れず、コピーしてソートするだけになる
+    filtered = messages
+    
+    # 基本フィルター（状態ビットをマスクして1回で判定）
+    mask = want = 0
+    if settings.unread_only:
+        mask |= _FLAG_READ
+    if settings.flagged_only:
+        mask |= _FLAG_FLAGGED
+        want |= _FLAG_FLAGGED
+    if settings.has_attachments:
+        mask |= _FLAG_ATTACHMENT
+        want |= _FLAG_ATTACHMENT
+    if mask:
+        filtered = [m for m in filtered if _flag_bits(m) & mask == want]
+    
+    # テキストフィルター
+    if sender_query:
+        filtered = [m for m in filtered if sender_query in _display_cache(m).sender_lc]
+    if subject_query:
+        filtered = [m for m in filtered if subject_query in _display_cache(m).subject_lc]
+    
+    # 検索クエリ
+    if search_query:
+        matches, search_cache = _match_search(messages, search_query, search_cache)
+        filtered = [m for m in filtered if id(m) in matches]
+    
+    # ソートで並べ替えるため、元のリストとは別のリストにする
+    if filtered is messages:
+        filtered = list(filtered)
+    
+    _sort_messages(filtered, sort_column, sort_order)
+    return filtered, search_cache
+
+
+class FlagUpdateBatcher:
+    """
+    フラグ更新のバッチャー
+    
+    続けて発生したフラグ更新要求をためておき、件数がmax_batchに達するか、
+    最初の要求からmax_wait_msが経過した時点でまとめて反映します。
+    アカウント・フォルダ・変更内容が同じ要求は1つのグループにまとめます。
+    
+    Attributes:
+        max_batch: ためておく最大件数
+        max_wait_ms: 反映までの最大待ち時間（ミリ秒）
+    """
+    
+    def __init__(self, widget, on_flush: Callable, max_batch: int = 64, max_wait_ms: int = 10):
+        """
+        バッチャーを初期化します
+        
+        Args:
+            widget: タイマーに使うウィジェット
+            on_flush: 反映時のコールバック。(メッセージリスト, 追加フラグ, 削除フラグ) のリストで呼ばれる
+            max_batch: ためておく最大件数
+            max_wait_ms: 反映までの最大待ち時間（ミリ秒）
+        """
+        self._widget = widget
+        self._on_flush = on_flush
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._groups: Dict[tuple, List[MailMessage]] = {}  # (アカウントID, フォルダ, 追加, 削除) → メッセージ
+        self._pending: Dict[int, tuple] = {}  # id(メッセージ) → 所属グループのキー
+        self._timer = None
+    
+    def submit(self, message: MailMessage, add_flags: tuple = (), remove_flags: tuple = ()):
+        """
+        フラグ更新要求を追加します
+        
+        Args:
+            message: 対象メッセージ
+            add_flags: 追加するフラグ
+            remove_flags: 削除するフラグ
+        """
+        key = (message.account_id, message.folder, tuple(add_flags), tuple(remove_flags))
+        pending_key = self._pending.get(id(message))
+        if pending_key == key:
+            return
+        if pending_key is not None:
+            # 同じメッセージへの別の変更は、順序を保つため先に反映する
+            self.flush()
+        
+        self._pending[id(message)] = key
+        self._groups.setdefault(key, []).append(message)
+        
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = self._widget.after(self.max_wait_ms, self._on_timer)
+    
+    def _on_timer(self):
+        """待ち時間経過時の処理"""
+        self._timer = None
+        self.flush()
+    
+    def flush(self):
+        """
+        ためている要求をすぐに反映します
+        """
+        if self._timer is not None:
+            self._widget.after_cancel(self._timer)
+            self._timer = None
+        
+        if not self._groups:
+            return
+        
+        groups, self._groups = self._groups, {}
+        self._pending = {}
+        self._on_flush([
+            (messages, add_flags, remove_flags)
+            for (_, _, add_flags, remove_flags), messages in groups.items()
+        ])
+
+
 class MailList(ttk.Frame):
     """
     メールリスト表示コンポーネントクラス
@@ -73,18 +436,24 @@ class MailList(ttk.Frame):
         on_selection_change: 選択変更コールバック
         on_double_click: ダブルクリックコールバック
         on_context_menu: コンテキストメニューコールバック
+        on_flags_change: フラグ変更コールバック
         messages: 表示中のメッセージリスト
         filtered_messages: フィルタリング後のメッセージリスト
         selected_messages: 選択中のメッセージリスト
         sort_column: 現在のソートカラム
         sort_order: 現在のソート順序
         filter_settings: フィルター設定
+        confirm_single_delete: 1件のみの削除でも確認ダイアログを表示するか
     """
     
     def __init__(self, master, 
                  on_selection_change: Optional[Callable] = None,
                  on_double_click: Optional[Callable] = None,
-                 on_context_menu: Optional[Callable] = None):
+                 on_context_menu: Optional[Callable] = None,
+                 on_flags_change: Optional[Callable] = None,
+                 flag_batch_size: int = 64,
+                 flag_batch_wait_ms: int = 10,
+                 confirm_single_delete: bool = False):
         """
         メールリストコンポーネントを初期化します
         
@@ -93,6 +462,13 @@ class MailList(ttk.Frame):
             on_selection_change: 選択変更時のコールバック
             on_double_click: ダブルクリック時のコールバック
             on_context_menu: 右クリック時のコールバック
+            on_flags_change: フラグ変更時のコールバック。
+                アカウント・フォルダごとに (メッセージリスト, 追加フラグ, 削除フラグ) で
+                1回ずつワーカースレッドから呼ばれ、Falseを返すか例外が発生すると
+                そのグループのフラグ変更を元に戻す
+            flag_batch_size: フラグ更新をまとめる最大件数
+            flag_batch_wait_ms: フラグ更新をまとめる最大待ち時間（ミリ秒）
+            confirm_single_delete: 1件のみの削除でも確認ダイアログを表示するか
         """
         super().__init__(master)
         
@@ -100,16 +476,24 @@ class MailList(ttk.Frame):
         self.on_selection_change = on_selection_change
         self.on_double_click = on_double_click
         self.on_context_menu = on_context_menu
+        self.on_flags_change = on_flags_change
         
         # データ管理
         self.messages: List[MailMessage] = []
         self.filtered_messages: List[MailMessage] = []
         self.selected_messages: List[MailMessage] = []
+        self._selected_ids: set = set()  # 選択中のメッセージID（所属判定用）
+        self._iid_to_message: Dict[str, MailMessage] = {}  # TreeviewのアイテムID → メッセージ
+        self._row_cache: Dict[str, tuple] = {}  # TreeviewのアイテムID → 表示中の (カラム値, タグ)
+        self._search_cache: Optional[tuple] = None  # (検索クエリ, 一致したメッセージのid()集合)
+        self._msg_index: Dict[str, int] = {}  # メッセージID → messages内の位置
+        self._filtered_pos: Optional[Dict[int, int]] = None  # id(メッセージ) → filtered_messages内の位置（必要時に作成）
         
         # ソート・フィルター設定
         self.sort_column = SortColumn.DATE
         self.sort_order = SortOrder.DESCENDING
         self.filter_settings = MailListFilter()
+        self.confirm_single_delete = confirm_single_delete
         
         # UI要素の参照
         self.tree = None
@@ -118,14 +502,26 @@ class MailList(ttk.Frame):
         self.filter_frame = None
         
         # 表示設定
-        self.items_per_page = 100  # 仮想スクロール用
+        self.items_per_page = 100  # 仮想スクロール用（Treeviewの大きさが決まると表示行数から決め直す）
         self.current_page = 0
+        self._rendered_count = 0  # Treeviewに描画済みの件数（filtered_messagesの先頭から）
+        self._page_pending = False
         self.show_preview = tk.BooleanVar(value=True)
         self.compact_view = tk.BooleanVar(value=False)
         
         # パフォーマンス設定
         self._update_pending = False
-        self._last_update_time = datetime.now()
+        self._last_update_time = time.monotonic()
+        self._redraw_pending = False
+        self._dirty_ids: set = set()  # 再描画待ちの行のメッセージID
+        self._filter_timer = None
+        self._filter_seq = 0  # 絞り込み要求の通し番号（古い結果の破棄用）
+        self._filter_pending = False  # バックグラウンドの絞り込み結果を待っているか
+        self._filter_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mail-list-filter")
+        self._flag_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mail-list-flags")
+        self._flag_batcher = FlagUpdateBatcher(self, self._commit_flag_updates,
+                                               max_batch=flag_batch_size,
+                                               max_wait_ms=flag_batch_wait_ms)
         
         # 侘び寂びスタイルの設定
         self._setup_wabi_sabi_style()
@@ -135,6 +531,16 @@ class MailList(ttk.Frame):
         
         logger.info("メールリストコンポーネントを初期化しました")
     
+    def destroy(self):
+        """
+        コンポーネントを破棄します
+        """
+        self._flag_batcher.flush()
+        # 送信済みのフラグ更新はサーバーへの反映を続ける
+        self._flag_executor.shutdown(wait=False)
+        self._filter_executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+    
     def _setup_wabi_sabi_style(self):
         """
         侘び寂びの美学に基づいたスタイルを設定します
@@ -181,6 +587,8 @@ class MailList(ttk.Frame):
         # 未読メール用スタイル
         style.configure("Unread.MailList.Treeview",
                        font=self.fonts['unread'])
+        
+        # 行ごとのタグ（未読・重要）はTreeview作成後に _create_treeview で一度だけ設定
     
     def _create_widgets(self):
         """
@@ -285,17 +693,17 @@ class MailList(ttk.Frame):
         self.unread_only_var = tk.BooleanVar()
         ttk.Checkbutton(top_row, text="未読のみ", 
                        variable=self.unread_only_var,
-                       command=self._on_filter_change).pack(side=tk.LEFT, padx=(0, 16))
+                       command=self._do_filter_change).pack(side=tk.LEFT, padx=(0, 16))
         
         self.flagged_only_var = tk.BooleanVar()
         ttk.Checkbutton(top_row, text="重要のみ", 
                        variable=self.flagged_only_var,
-                       command=self._on_filter_change).pack(side=tk.LEFT, padx=(0, 16))
+                       command=self._do_filter_change).pack(side=tk.LEFT, padx=(0, 16))
         
         self.attachments_only_var = tk.BooleanVar()
         ttk.Checkbutton(top_row, text="添付ありのみ", 
                        variable=self.attachments_only_var,
-                       command=self._on_filter_change).pack(side=tk.LEFT)
+                       command=self._do_filter_change).pack(side=tk.LEFT)
         
         # 下段：テキストフィルター
         bottom_row = ttk.Frame(filter_content)
@@ -337,16 +745,23 @@ class MailList(ttk.Frame):
                                 style="MailList.Treeview",
                                 selectmode="extended")
         
-        # カラムヘッダー設定
-        self.tree.heading("flags", text="", anchor=tk.W, 
+        # カラムヘッダー設定（ソートインジケーターを付ける前の見出し）
+        self._column_labels = {
+            "flags": "",
+            "sender": "送信者",
+            "subject": "件名",
+            "date": "日時",
+            "size": "サイズ",
+        }
+        self.tree.heading("flags", text=self._column_labels["flags"], anchor=tk.W, 
                          command=lambda: self._on_column_click(SortColumn.FLAGS))
-        self.tree.heading("sender", text="送信者", anchor=tk.W,
+        self.tree.heading("sender", text=self._column_labels["sender"], anchor=tk.W,
                          command=lambda: self._on_column_click(SortColumn.SENDER))
-        self.tree.heading("subject", text="件名", anchor=tk.W,
+        self.tree.heading("subject", text=self._column_labels["subject"], anchor=tk.W,
                          command=lambda: self._on_column_click(SortColumn.SUBJECT))
-        self.tree.heading("date", text="日時", anchor=tk.W,
+        self.tree.heading("date", text=self._column_labels["date"], anchor=tk.W,
                          command=lambda: self._on_column_click(SortColumn.DATE))
-        self.tree.heading("size", text="サイズ", anchor=tk.W,
+        self.tree.heading("size", text=self._column_labels["size"], anchor=tk.W,
                          command=lambda: self._on_column_click(SortColumn.SIZE))
         
         # カラム幅設定
@@ -360,7 +775,10 @@ class MailList(ttk.Frame):
         v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
         
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self._v_scrollbar = v_scrollbar
+        # 一括更新中に付け外しするため、Tclコマンドとして一度だけ登録しておく
+        self._yscroll_command = self.tree.register(self._on_tree_yscroll)
+        self.tree.configure(yscrollcommand=self._yscroll_command, xscrollcommand=h_scrollbar.set)
         
         # レイアウト
         self.tree.grid(row=0, column=0, sticky="nsew")
@@ -370,12 +788,24 @@ class MailList(ttk.Frame):
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
         
+        # 行タグのスタイル
+        self.tree.tag_configure("unread", font=self.fonts['unread'])
+        self.tree.tag_configure("flagged", foreground=self.colors['flagged'])
+        
         # イベントバインド
         self.tree.bind("<<TreeviewSelect>>", self._on_selection_change_event)
         self.tree.bind("<Double-1>", self._on_double_click_event)
         self.tree.bind("<Button-3>", self._on_right_click_event)
         self.tree.bind("<Return>", self._on_enter_key)
         self.tree.bind("<Delete>", self._on_delete_key)
+        self.tree.bind("<Configure>", self._on_tree_configure)
+        
+        # ページの行数を表示行数から決めるための行の高さ
+        row_height = ttk.Style().lookup("MailList.Treeview", "rowheight")
+        try:
+            self._row_height = int(row_height) or DEFAULT_ROW_HEIGHT
+        except (TypeError, ValueError):
+            self._row_height = DEFAULT_ROW_HEIGHT
     
     def _create_status_bar(self, parent):
         """
@@ -401,14 +831,14 @@ class MailList(ttk.Frame):
         self.context_menu = tk.Menu(self, tearoff=0)
         
         self.context_menu.add_command(label="📖 既読にする", 
-                                     command=self._on_mark_read)
+                                     command=partial(self._apply_flags, add_flags=(MessageFlag.SEEN,)))
         self.context_menu.add_command(label="📩 未読にする", 
-                                     command=self._on_mark_unread)
+                                     command=partial(self._apply_flags, remove_flags=(MessageFlag.SEEN,)))
         self.context_menu.add_separator()
         self.context_menu.add_command(label="⭐ 重要マーク", 
-                                     command=self._on_mark_flagged)
+                                     command=partial(self._apply_flags, add_flags=(MessageFlag.FLAGGED,)))
         self.context_menu.add_command(label="⭐ 重要解除", 
-                                     command=self._on_unmark_flagged)
+                                     command=partial(self._apply_flags, remove_flags=(MessageFlag.FLAGGED,)))
         self.context_menu.add_separator()
         self.context_menu.add_command(label="↩️ 返信", 
                                      command=self._on_reply)
@@ -417,6 +847,13 @@ class MailList(ttk.Frame):
         self.context_menu.add_separator()
         self.context_menu.add_command(label="🗑️ 削除", 
                                      command=self._on_delete)
+        
+        # 表示時に有効・無効を切り替える項目
+        self._context_menu_commands = [
+            index for index in range(self.context_menu.index(tk.END) + 1)
+            if self.context_menu.type(index) == "command"
+        ]
+        self._context_menu_state = tk.NORMAL
     
     def _setup_keyboard_bindings(self):
         """
@@ -438,14 +875,16 @@ class MailList(ttk.Frame):
             messages: 表示するメッセージリスト
             folder_name: フォルダ名
         """
-        self.messages = messages.copy()
+        self.messages = list(messages)
+        self._rebuild_derived()
+        self._rendered_count = 0  # 新しいリストは先頭ページから表示する
         self.title_label.config(text=f"📥 {folder_name}")
         
         # フィルターを適用して表示を更新
         self._apply_filters()
         self._update_display()
         
-        logger.debug(f"メッセージリストを設定しました: {len(messages)}件")
+        logger.debug(f"メッセージリストを設定しました: {len(self.messages)}件")
     
     def add_messages(self, messages: List[MailMessage]):
         """
@@ -454,7 +893,12 @@ class MailList(ttk.Frame):
         Args:
             messages: 追加するメッセージリスト
         """
+        start = len(self.messages)
         self.messages.extend(messages)
+        for i, msg in enumerate(messages, start):
+            self._msg_index.setdefault(msg.message_id, i)
+            _display_cache(msg)
+        self._search_cache = None
         self._apply_filters()
         self._update_display()
         
@@ -467,14 +911,103 @@ class MailList(ttk.Frame):
         Args:
             message: 更新するメッセージ
         """
-        # 既存メッセージを検索して更新
-        for i, msg in enumerate(self.messages):
-            if msg.message_id == message.message_id:
-                self.messages[i] = message
-                break
+        i = self._msg_index.get(message.message_id)
+        if i is None:
+            return
         
-        self._apply_filters()
-        self._update_display()
+        old = self.messages[i]
+        old_key = None if self.sort_column == SortColumn.FLAGS else _sort_key(old, self.sort_column)
+        _invalidate_display_cache(old)
+        _invalidate_display_cache(message)
+        self.messages[i] = message
+        self._search_cache = None
+        
+        # バックグラウンドの絞り込みが実行中なら、その結果は更新前のメッセージを含むため
+        # 差分更新はせず全体を再計算する（_apply_filters が実行中の結果を破棄する）
+        if self._filter_pending or not self._update_filtered_message(old, message, old_key):
+            # 表示対象への追加や並び順の変化があれば全体を再計算
+            self._apply_filters()
+            self._update_display()
+    
+    def _update_filtered_message(self, old: MailMessage, message: MailMessage, old_key) -> bool:
+        """
+        フィルター・ソート結果を保ったまま、1件のメッセージの表示を更新します
+        
+        Args:
+            old: 更新前のメッセージ
+            message: 更新後のメッセージ
+            old_key: 更新前のソートキー（フラグ順ソートではNone）
+        
+        Returns:
+            bool: 差分更新できた場合True。全体の再計算が必要な場合False
+        """
+        if self._filtered_pos is None:
+            self._filtered_pos = {id(m): pos for pos, m in enumerate(self.filtered_messages)}
+        
+        pos = self._filtered_pos.get(id(old))
+        if pos is None:
+            # 表示対象外だったメッセージが条件に合うようになったかは挿入位置も含めて再計算する
+            return False
+        
+        settings, search_query = self._read_filter_settings()
+        passes = bool(_compute_filtered([message], settings, search_query,
+                                        self.sort_column, self.sort_order, None)[0])
+        item_id = self._find_item_id(old)
+        
+        if not passes:
+            # 条件に合わなくなった行だけを取り除く
+            del self.filtered_messages[pos]
+            self._filtered_pos = None
+            if item_id is not None:
+                self.tree.delete(item_id)
+                del self._iid_to_message[item_id]
+                del self._row_cache[item_id]
+                self._rendered_count -= 1
+            self._update_count_label()
+            return True
+        
+        if old_key is None or _sort_key(message, self.sort_column) != old_key:
+            return False
+        
+        # 位置は変わらないため、その行の表示だけを更新
+        self.filtered_messages[pos] = message
+        del self._filtered_pos[id(old)]
+        self._filtered_pos[id(message)] = pos
+        if item_id is not None:
+            self._iid_to_message[item_id] = message
+            self._refresh_item(item_id, message)
+        return True
+    
+    def _find_item_id(self, message: MailMessage) -> Optional[str]:
+        """
+        メッセージを表示しているTreeviewのアイテムIDを取得します
+        
+        Args:
+            message: 対象メッセージ
+        
+        Returns:
+            Optional[str]: アイテムID、描画されていなければNone
+        """
+        if self._iid_to_message.get(message.message_id) is message:
+            return message.message_id
+        # メッセージIDが重複してTkが採番した行
+        for item_id, shown in self._iid_to_message.items():
+            if shown is message:
+                return item_id
+        return None
+    
+    def _rebuild_derived(self):
+        """
+        メッセージ一覧から派生する索引とキャッシュを作り直します
+        
+        メッセージIDの索引と表示用キャッシュを1回の走査でまとめて作成し、
+        検索キャッシュを破棄します。
+        """
+        self._msg_index = {}
+        for i, msg in enumerate(self.messages):
+            self._msg_index.setdefault(msg.message_id, i)
+            _display_cache(msg)
+        self._search_cache = None
     
     def remove_messages(self, message_ids: List[str]):
         """
@@ -483,7 +1016,15 @@ class MailList(ttk.Frame):
         Args:
             message_ids: 削除するメッセージIDリスト
         """
-        self.messages = [msg for msg in self.messages if msg.message_id not in message_ids]
+        removed_ids = set(message_ids)
+        kept = []
+        for msg in self.messages:
+            if msg.message_id in removed_ids:
+                _invalidate_display_cache(msg)
+            else:
+                kept.append(msg)
+        self.messages = kept
+        self._rebuild_derived()
         self._apply_filters()
         self._update_display()
         
@@ -498,6 +1039,15 @@ class MailList(ttk.Frame):
         """
         return self.selected_messages.copy()
     
+    def get_selected_ids(self) -> set:
+        """
+        選択中のメッセージIDを取得します
+        
+        Returns:
+            set: 選択中のメッセージIDの集合
+        """
+        return self._selected_ids.copy()
+    
     def get_selected_message(self) -> Optional[MailMessage]:
         """
         最初に選択されたメッセージを取得します
@@ -505,11 +1055,15 @@ class MailList(ttk.Frame):
         Returns:
             Optional[MailMessage]: 選択されたメッセージ、なければNone
         """
-        return self.selected_messages[0] if self.selected_messages else None
+        messages = self.selected_messages
+        return messages[0] if messages else None
     
-    def _apply_filters(self):
+    def _read_filter_settings(self) -> tuple:
         """
-        フィルター設定を適用します
+        フィルター入力欄の状態を読み取ります
+        
+        Returns:
+            tuple: (フィルター設定のコピー, 小文字化済みの検索クエリ)
         """
         # フィルター設定を更新
         self.filter_settings.unread_only = self.unread_only_var.get() if hasattr(self, 'unread_only_var') else False
@@ -521,93 +1075,129 @@ class MailList(ttk.Frame):
         # 検索クエリ
         search_query = self.search_entry.get().lower() if hasattr(self, 'search_entry') else ""
         
-        # フィルタリング実行
-        self.filtered_messages = []
+        return replace(self.filter_settings), search_query
+    
+    def _apply_filters(self):
+        """
+        フィルター設定を適用します
+        """
+        # 実行中のバックグラウンド絞り込みがあれば、その結果は使わない
+        self._filter_seq += 1
+        self._filter_pending = False
+        
+        settings, search_query = self._read_filter_settings()
+        self.filtered_messages, self._search_cache = _compute_filtered(
+            self.messages, settings, search_query,
+            self.sort_column, self.sort_order, self._search_cache
+        )
+        self._filtered_pos = None
+    
+    def _apply_filters_async(self):
+        """
+        フィルター設定をワーカースレッドで適用します
+        
+        完了時にメインスレッドで結果を差し替えます。
+        結果が届く前に別の絞り込みが始まった場合、古い結果は破棄します。
+        ワーカーには一覧のコピーを渡し、表示用キャッシュもここで作成しておくため、
+        実行中にメインスレッドで一覧やキャッシュが変わっても影響しません。
+        """
+        self._filter_seq += 1
+        seq = self._filter_seq
+        self._filter_pending = True
         
-        for message in self.messages:
-            # 基本フィルター
-            if self.filter_settings.unread_only and message.is_read():
-                continue
-            if self.filter_settings.flagged_only and not message.is_flagged():
-                continue
-            if self.filter_settings.has_attachments and not message.has_attachments():
-                continue
-            
-            # テキストフィルター
-            if self.filter_settings.sender_filter:
-                if self.filter_settings.sender_filter.lower() not in message.sender.lower():
-                    continue
-            
-            if self.filter_settings.subject_filter:
-                if self.filter_settings.subject_filter.lower() not in message.subject.lower():
-                    continue
-            
-            # 検索クエリ
+        settings, search_query = self._read_filter_settings()
+        messages = list(self.messages)
+        for msg in messages:
             if search_query:
-                searchable_text = f"{message.sender} {message.subject} {message.body_text}".lower()
-                if search_query not in searchable_text:
-                    continue
-            
-            self.filtered_messages.append(message)
+                _searchable_text(msg)
+            else:
+                _display_cache(msg)
+        
+        future = self._filter_executor.submit(
+            _compute_filtered, messages, settings, search_query,
+            self.sort_column, self.sort_order, self._search_cache
+        )
+        future.add_done_callback(lambda f: self._post_filter_result(seq, f))
+    
+    def _post_filter_result(self, seq: int, future):
+        """
+        絞り込み結果をメインスレッドへ渡します（ワーカースレッドから呼ばれる）
         
-        # ソートを適用
-        self._apply_sort()
+        Args:
+            seq: 絞り込みの通し番号
+            future: 絞り込み処理のFuture
+        """
+        try:
+            self.after(0, self._apply_filter_result, seq, future)
+        except (RuntimeError, tk.TclError):
+            # ウィジェット破棄後は何もしない
+            pass
+    
+    def _apply_filter_result(self, seq: int, future):
+        """
+        絞り込み結果を反映します
+        
+        Args:
+            seq: 絞り込みの通し番号
+            future: 絞り込み処理のFuture
+        """
+        if seq != self._filter_seq or future.cancelled():
+            return
+        self._filter_pending = False
+        
+        try:
+            self.filtered_messages, self._search_cache = future.result()
+            self._filtered_pos = None
+        except Exception as e:
+            logger.error(f"フィルター適用エラー: {e}")
+            self.status_label.config(text=f"フィルター適用エラー: {e}")
+            return
+        
+        self._update_display()
     
     def _apply_sort(self):
         """
         ソート設定を適用します
         """
-        reverse = (self.sort_order == SortOrder.DESCENDING)
-        
-        if self.sort_column == SortColumn.DATE:
-            self.filtered_messages.sort(key=lambda msg: msg.get_display_date(), reverse=reverse)
-        elif self.sort_column == SortColumn.SENDER:
-            self.filtered_messages.sort(key=lambda msg: msg.sender.lower(), reverse=reverse)
-        elif self.sort_column == SortColumn.SUBJECT:
-            self.filtered_messages.sort(key=lambda msg: msg.subject.lower(), reverse=reverse)
-        elif self.sort_column == SortColumn.SIZE:
-            self.filtered_messages.sort(key=lambda msg: len(msg.body_text) + len(msg.body_html), reverse=reverse)
-        elif self.sort_column == SortColumn.FLAGS:
-            self.filtered_messages.sort(key=lambda msg: (not msg.is_read(), msg.is_flagged()), reverse=reverse)
+        _sort_messages(self.filtered_messages, self.sort_column, self.sort_order)
+        self._filtered_pos = None
     
     def _update_display(self):
         """
         表示を更新します
         """
-        # 更新頻度制限
-        now = datetime.now()
-        if self._update_pending or (now - self._last_update_time).total_seconds() < 0.1:
+        # 予約済みの更新があればそれにまとめる
+        if self._update_pending:
             return
         
         self._update_pending = True
-        self._last_update_time = now
         
-        # 少し遅延させて更新（UI応答性向上）
-        self.after(50, self._do_update_display)
+        # 更新頻度制限（前回から0.1秒未満なら残り時間だけ待つ）
+        wait = 0.1 - (time.monotonic() - self._last_update_time)
+        if wait > 0:
+            self.after(int(wait * 1000) + 1, self._do_update_display)
+        else:
+            # イベント処理が落ち着いたらすぐに更新
+            self.after_idle(self._do_update_display)
     
     def _do_update_display(self):
         """
         実際の表示更新処理
         """
+        # 更新中に来た要求は次回の更新として予約できるようにする
+        self._update_pending = False
+        self._last_update_time = time.monotonic()
+        
         try:
-            # 既存のアイテムをクリア
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            
-            # メッセージを表示
-            for message in self.filtered_messages:
-                self._add_message_to_tree(message)
+            # 表示範囲（と選択中の行）までに先読み1ページを加えた分だけを差分更新し、
+            # それより下の描画済みの行は取り除く（スクロールすると再び描画される）
+            count = min(len(self.filtered_messages),
+                        self._rows_to_keep() + self.items_per_page)
+            with self._suspend_scroll_updates():
+                self._sync_rendered_rows(count)
             
             # 件数を更新
-            total_count = len(self.messages)
-            filtered_count = len(self.filtered_messages)
-            
-            if total_count == filtered_count:
-                count_text = f"({total_count}件)"
-            else:
-                count_text = f"({filtered_count}/{total_count}件)"
-            
-            self.count_label.config(text=count_text)
+            self._update_count_label()
             
             # ステータスを更新
             self.status_label.config(text=f"メール一覧を更新しました")
@@ -615,28 +1205,244 @@ class MailList(ttk.Frame):
         except Exception as e:
             logger.error(f"表示更新エラー: {e}")
             self.status_label.config(text=f"表示更新エラー: {e}")
+    
+    def _request_redraw(self, message_ids: set):
+        """
+        指定したメッセージの行の再描画を要求します
+        
+        同じイベントループ内の要求は、アイドル時の1回の再描画にまとめます。
+        
+        Args:
+            message_ids: 表示を更新するメッセージIDの集合
+        """
+        self._dirty_ids |= message_ids
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+    
+    def _flush_redraw(self):
+        """
+        要求された行だけを再描画します
+        """
+        self._redraw_pending = False
+        dirty_ids, self._dirty_ids = self._dirty_ids, set()
+        
+        for message_id in dirty_ids:
+            i = self._msg_index.get(message_id)
+            if i is None:
+                continue
+            message = self.messages[i]
+            # 未描画の行は描画時に最新の状態で作られる
+            item_id = self._find_item_id(message)
+            if item_id is not None:
+                self._refresh_item(item_id, message)
+    
+    def _update_count_label(self):
+        """
+        件数表示を更新します
+        """
+        total_count = len(self.messages)
+        filtered_count = len(self.filtered_messages)
+        
+        if total_count == filtered_count:
+            count_text = f"({total_count}件)"
+        else:
+            count_text = f"({filtered_count}/{total_count}件)"
+        
+        self.count_label.config(text=count_text)
+    
+    @contextmanager
+    def _suspend_scroll_updates(self):
+        """
+        Treeviewを一括変更する間、スクロール通知を止めます
+        
+        行の追加・削除のたびにスクロールバーやページ読み込みの判定が走らないよう、
+        変更が終わってから一度だけ通知されるようにします。
+        """
+        self.tree.configure(yscrollcommand="")
+        try:
+            yield
         finally:
-            self._update_pending = False
+            self.tree.configure(yscrollcommand=self._yscroll_command)
     
-    def _add_message_to_tree(self, message: MailMessage):
+    def _sync_rendered_rows(self, count: int):
+        """
+        Treeviewの行を filtered_messages の先頭 count 件と一致させます
+        
+        消えた行の削除・新しい行の挿入・並び替えだけを行い、
+        残った行は表示内容が変わった場合のみ更新します。
+        
+        Args:
+            count: 描画する件数
+        """
+        targets = self.filtered_messages[:count]
+        target_ids = {id(message) for message in targets}
+        
+        # 表示されなくなった行を削除
+        current_iids = {}
+        removed = []
+        for item_id in self.tree.get_children():
+            message = self._iid_to_message.get(item_id)
+            if message is not None and id(message) in target_ids:
+                current_iids[id(message)] = item_id
+            else:
+                removed.append(item_id)
+        if removed:
+            self.tree.delete(*removed)
+            for item_id in removed:
+                self._iid_to_message.pop(item_id, None)
+                self._row_cache.pop(item_id, None)
+        
+        # 残った行の相対順序が変わった場合のみ移動が必要
+        kept_order = [current_iids[id(m)] for m in targets if id(m) in current_iids]
+        reorder = kept_order != list(self.tree.get_children())
+        
+        for index, message in enumerate(targets):
+            item_id = current_iids.get(id(message))
+            if item_id is None:
+                self._add_message_to_tree(message, index)
+                continue
+            
+            if reorder:
+                self.tree.move(item_id, "", index)
+            self._refresh_item(item_id, message)
+        
+        self._rendered_count = count
+        self.current_page = (count - 1) // self.items_per_page if count else 0
+    
+    def _rows_to_keep(self) -> int:
+        """
+        再描画時に残す必要のある行数を求めます
+        
+        表示範囲の下端までの行と、選択中のメッセージの行は残します。
+        
+        Returns:
+            int: filtered_messages の先頭から残す件数
+        """
+        keep = 0
+        if self._rendered_count:
+            keep = math.ceil(float(self.tree.yview()[1]) * self._rendered_count)
+        
+        if self._selected_ids:
+            messages = self.filtered_messages
+            for pos in range(len(messages) - 1, keep - 1, -1):
+                if messages[pos].message_id in self._selected_ids:
+                    keep = pos + 1
+                    break
+        return keep
+    
+    def _on_tree_configure(self, event):
+        """
+        Treeviewの大きさ変更イベント（1ページの行数を表示できる行数に合わせる）
+        """
+        visible_rows = max(1, event.height // self._row_height)
+        self.items_per_page = max(MIN_PAGE_ROWS, visible_rows * PAGE_VIEWPORTS)
+    
+    def _render_next_page(self):
+        """
+        未描画のメッセージを1ページ分Treeviewに追加します
+        """
+        start = self._rendered_count
+        end = min(start + self.items_per_page, len(self.filtered_messages))
+        
+        for message in self.filtered_messages[start:end]:
+            self._add_message_to_tree(message)
+        
+        self._rendered_count = end
+        self.current_page = (end - 1) // self.items_per_page if end else 0
+    
+    def _render_all_pages(self):
+        """
+        残りのメッセージをすべてTreeviewに追加します
+        """
+        with self._suspend_scroll_updates():
+            while self._rendered_count < len(self.filtered_messages):
+                self._render_next_page()
+    
+    def _on_tree_yscroll(self, first, last):
+        """
+        Treeviewの縦スクロール通知
+        
+        スクロールバーへ位置を伝え、表示範囲が末尾に近づいたら次のページの描画を予約します。
+        
+        Args:
+            first: 表示範囲の上端（0.0〜1.0）
+            last: 表示範囲の下端（0.0〜1.0）
+        """
+        self._v_scrollbar.set(first, last)
+        
+        if (not self._page_pending
+                and self._rendered_count < len(self.filtered_messages)
+                and float(last) >= SCROLL_PRELOAD_THRESHOLD):
+            # スクロール通知の処理中にアイテムを追加しないよう、アイドル時に描画する
+            self._page_pending = True
+            self.after_idle(self._load_next_page)
+    
+    def _load_next_page(self):
+        """
+        スクロールに応じて次のページを描画します
+        """
+        self._page_pending = False
+        self._render_next_page()
+    
+    def _add_message_to_tree(self, message: MailMessage, index="end"):
         """
         メッセージをTreeviewに追加します
         
         Args:
             message: 追加するメッセージ
+            index: 挿入位置（省略時は末尾）
         """
-        # フラグアイコン
-        flags = ""
-        if not message.is_read():
-            flags += "📩"
-        else:
-            flags += "📖"
+        values = self._render_values(message)
+        tags = self._render_tags(message)
         
-        if message.is_flagged():
-            flags += "⭐"
+        # アイテムを挿入（メッセージIDをアイテムIDとして使い、重複時はTkに採番させる）
+        iid = message.message_id
+        if not iid or iid in self._iid_to_message:
+            iid = None
+        item_id = self.tree.insert("", index, iid=iid, values=values, tags=tags)
         
-        if message.has_attachments():
-            flags += "📎"
+        # メッセージオブジェクトを関連付け
+        self._iid_to_message[item_id] = message
+        self._row_cache[item_id] = (values, tags)
+    
+    def _refresh_item(self, item_id: str, message: MailMessage):
+        """
+        描画済みの行を、表示内容が変わった場合だけ更新します
+        
+        Args:
+            item_id: TreeviewのアイテムID
+            message: 行に表示するメッセージ
+        """
+        row = (self._render_values(message), self._render_tags(message))
+        if row != self._row_cache.get(item_id):
+            self.tree.item(item_id, values=row[0], tags=row[1])
+            self._row_cache[item_id] = row
+    
+    def _render_tags(self, message: MailMessage) -> tuple:
+        """
+        メッセージの行に付けるタグを作成します
+        
+        Args:
+            message: 対象メッセージ
+            
+        Returns:
+            tuple: 未読なら "unread"、重要なら "flagged" を含むタグ
+        """
+        return _FLAG_TAGS[_flag_bits(message)]
+    
+    def _render_values(self, message: MailMessage) -> tuple:
+        """
+        メッセージの各カラムの表示値を作成します
+        
+        Args:
+            message: 対象メッセージ
+            
+        Returns:
+            tuple: (フラグ, 送信者, 件名, 日時, サイズ) の表示文字列
+        """
+        # フラグアイコン
+        flags = _FLAG_GLYPHS[_flag_bits(message)]
         
         # 送信者表示（コンパクトモードで調整）
         sender = message.sender
@@ -657,46 +1463,26 @@ class MailList(ttk.Frame):
         if len(subject) > max_subject_length:
             subject = subject[:max_subject_length-3] + "..."
         
+        cache = _display_cache(message)
+        
         # 日時表示
-        date_str = message.get_display_date().strftime("%m/%d %H:%M")
+        date_str = cache.date_str
         
         # サイズ表示（推定）
-        size = len(message.body_text) + len(message.body_html)
-        if size < 1024:
-            size_str = f"{size}B"
-        elif size < 1024 * 1024:
-            size_str = f"{size//1024}KB"
-        else:
-            size_str = f"{size//(1024*1024)}MB"
-        
-        # アイテムを挿入
-        item_id = self.tree.insert("", "end", values=(
-            flags, sender, subject, date_str, size_str
-        ))
+        size_str = cache.size_str
         
-        # メッセージオブジェクトを関連付け
-        self.tree.set(item_id, "message_obj", message)
-        
-        # 未読メールのスタイル適用
-        if not message.is_read():
-            self.tree.set(item_id, "tags", ("unread",))
-            self.tree.tag_configure("unread", font=self.fonts['unread'])
+        return (flags, sender, subject, date_str, size_str)
     
     # イベントハンドラー
     def _on_selection_change_event(self, event):
         """選択変更イベント"""
-        selection = self.tree.selection()
-        self.selected_messages = []
-        
-        for item_id in selection:
-            # メッセージオブジェクトを取得
-            for message in self.filtered_messages:
-                tree_values = self.tree.item(item_id, "values")
-                if tree_values and len(tree_values) > 1:
-                    # 送信者で判定（簡易）
-                    if message.sender.startswith(tree_values[1].replace("...", "")):
-                        self.selected_messages.append(message)
-                        break
+        # 選択中のメッセージはここで一度だけ解決し、各アクションはこのリストを使う
+        self.selected_messages = [
+            self._iid_to_message[item_id]
+            for item_id in self.tree.selection()
+            if item_id in self._iid_to_message
+        ]
+        self._selected_ids = {message.message_id for message in self.selected_messages}
         
         # 選択状況を更新
         count = len(self.selected_messages)
@@ -718,17 +1504,25 @@ class MailList(ttk.Frame):
     
     def _on_right_click_event(self, event):
         """右クリックイベント"""
-        # アイテムを選択
+        # 選択範囲外の行であれば、その行だけを選択（複数選択中の行はそのまま）
         item = self.tree.identify_row(event.y)
-        if item:
+        message = self._iid_to_message.get(item)
+        if message is not None and message.message_id not in self._selected_ids:
             self.tree.selection_set(item)
             self._on_selection_change_event(event)
-            
-            # コンテキストメニューを表示
-            try:
-                self.context_menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                self.context_menu.grab_release()
+        
+        # 作成済みのメニューを使い回し、有効・無効は変わったときだけ切り替える
+        state = tk.NORMAL if self.selected_messages else tk.DISABLED
+        if state != self._context_menu_state:
+            for index in self._context_menu_commands:
+                self.context_menu.entryconfigure(index, state=state)
+            self._context_menu_state = state
+        
+        # コンテキストメニューを表示
+        try:
+            self.context_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self.context_menu.grab_release()
     
     def _on_column_click(self, column: SortColumn):
         """カラムクリックイベント（ソート）"""
@@ -748,25 +1542,11 @@ class MailList(ttk.Frame):
     
     def _update_sort_indicators(self):
         """ソートインジケーターを更新"""
-        # すべてのヘッダーをクリア
-        for col in ["flags", "sender", "subject", "date", "size"]:
-            self.tree.heading(col, text=self.tree.heading(col)["text"].replace(" ↑", "").replace(" ↓", ""))
-        
-        # 現在のソートカラムにインジケーター追加
+        active = self.sort_column.value
         indicator = " ↑" if self.sort_order == SortOrder.ASCENDING else " ↓"
         
-        if self.sort_column == SortColumn.SENDER:
-            current_text = self.tree.heading("sender")["text"]
-            self.tree.heading("sender", text=current_text + indicator)
-        elif self.sort_column == SortColumn.SUBJECT:
-            current_text = self.tree.heading("subject")["text"]
-            self.tree.heading("subject", text=current_text + indicator)
-        elif self.sort_column == SortColumn.DATE:
-            current_text = self.tree.heading("date")["text"]
-            self.tree.heading("date", text=current_text + indicator)
-        elif self.sort_column == SortColumn.SIZE:
-            current_text = self.tree.heading("size")["text"]
-            self.tree.heading("size", text=current_text + indicator)
+        for col, label in self._column_labels.items():
+            self.tree.heading(col, text=label + indicator if col == active else label)
     
     def _on_search_change(self, event):
         """検索入力変更イベント"""
@@ -782,13 +1562,20 @@ class MailList(ttk.Frame):
     
     def _execute_search(self):
         """検索を実行"""
-        self._apply_filters()
-        self._update_display()
+        self._apply_filters_async()
     
     def _on_filter_change(self, event=None):
-        """フィルター変更イベント"""
-        self._apply_filters()
-        self._update_display()
+        """フィルター入力変更イベント"""
+        # 遅延フィルター（入力が0.3秒止まってから実行）
+        if self._filter_timer:
+            self.after_cancel(self._filter_timer)
+        
+        self._filter_timer = self.after(300, self._do_filter_change)
+    
+    def _do_filter_change(self):
+        """フィルターを適用"""
+        self._filter_timer = None
+        self._apply_filters_async()
     
     def _on_filter_clear(self):
         """フィルタークリアイベント"""
@@ -799,8 +1586,7 @@ class MailList(ttk.Frame):
         self.subject_filter_entry.delete(0, tk.END)
         self.search_entry.delete(0, tk.END)
         
-        self._apply_filters()
-        self._update_display()
+        self._do_filter_change()
     
     def _on_filter_click(self):
         """フィルターボタンクリックイベント"""
@@ -826,11 +1612,12 @@ class MailList(ttk.Frame):
             self.on_double_click(self.selected_messages[0])
     
     def _on_delete_key(self, event):
-        """デリートキーイベント"""
-        self._on_delete()
+        """デリートキーイベント（Shiftキー併用時は確認せずに削除）"""
+        self._on_delete(confirm=not (event.state & _SHIFT_MASK))
     
     def _on_select_all(self, event):
         """全選択イベント"""
+        self._render_all_pages()
         self.tree.selection_set(self.tree.get_children())
         return "break"
     
@@ -861,68 +1648,134 @@ class MailList(ttk.Frame):
         if selection:
             current = selection[0]
             next_item = self.tree.next(current)
+            if not next_item and self._rendered_count < len(self.filtered_messages):
+                self._render_next_page()
+                next_item = self.tree.next(current)
             if next_item:
                 self.tree.selection_set(next_item)
                 self.tree.see(next_item)
                 return "break"
     
     # コンテキストメニューアクション
-    def _on_mark_read(self):
-        """既読マークアクション"""
+    def _apply_flags(self, add_flags: tuple = (), remove_flags: tuple = ()):
+        """
+        選択中のメッセージのフラグ更新を要求します（既読・未読・重要マーク操作）
+        
+        要求はバッチャーにためられ、続けて発生した要求とまとめて反映されます。
+        
+        Args:
+            add_flags: 追加するフラグ
+            remove_flags: 削除するフラグ
+        """
+        submit = self._flag_batcher.submit
         for message in self.selected_messages:
-            message.mark_as_read()
-        self._update_display()
+            submit(message, add_flags, remove_flags)
     
-    def _on_mark_unread(self):
-        """未読マークアクション"""
-        for message in self.selected_messages:
-            message.mark_as_unread()
-        self._update_display()
+    def _commit_flag_updates(self, groups: List[tuple]):
+        """
+        まとめられたフラグ更新を反映します
+        
+        ローカルの状態を先に更新して再描画し、サーバーへの反映は
+        ワーカースレッドで行います。アカウント・フォルダ・変更内容ごとに
+        on_flags_changeを1回だけ呼び出し、1回の要求にまとめます。
+        
+        Args:
+            groups: (メッセージリスト, 追加フラグ, 削除フラグ) のリスト
+        """
+        for messages, add_flags, remove_flags in groups:
+            # 失敗時に戻せるよう、実際に変わったメッセージとフラグだけを記録する
+            changes = []
+            for message in messages:
+                before = set(message.flags)
+                if message.update_flags(add_flags, remove_flags):
+                    changes.append((message,
+                                    tuple(flag for flag in add_flags if flag not in before),
+                                    tuple(flag for flag in remove_flags if flag in before)))
+            
+            self._request_redraw({message.message_id for message, _, _ in changes})
+            
+            if self.on_flags_change:
+                future = self._flag_executor.submit(self.on_flags_change, messages, add_flags, remove_flags)
+                future.add_done_callback(lambda f, changes=changes: self._post_flag_result(changes, f))
     
-    def _on_mark_flagged(self):
-        """重要マークアクション"""
-        for message in self.selected_messages:
-            message.add_flag(MessageFlag.FLAGGED)
-        self._update_display()
+    def _post_flag_result(self, changes: List[tuple], future):
+        """
+        フラグ更新の結果をメインスレッドへ渡します（ワーカースレッドから呼ばれる）
+        
+        Args:
+            changes: (メッセージ, 追加したフラグ, 削除したフラグ) のリスト
+            future: サーバーへの反映処理のFuture
+        """
+        try:
+            self.after(0, self._apply_flag_result, changes, future)
+        except (RuntimeError, tk.TclError):
+            # ウィジェット破棄後は何もしない
+            pass
     
-    def _on_unmark_flagged(self):
-        """重要解除アクション"""
-        for message in self.selected_messages:
-            message.remove_flag(MessageFlag.FLAGGED)
-        self._update_display()
+    def _apply_flag_result(self, changes: List[tuple], future):
+        """
+        フラグ更新の結果を確認し、失敗していればローカルの状態を元に戻します
+        
+        Args:
+            changes: (メッセージ, 追加したフラグ, 削除したフラグ) のリスト
+            future: サーバーへの反映処理のFuture
+        """
+        if future.cancelled():
+            return
+        
+        try:
+            if future.result() is not False:
+                return
+            error = "サーバーが拒否しました"
+        except Exception as e:
+            error = e
+        
+        for message, added, removed in changes:
+            message.update_flags(add_flags=removed, remove_flags=added)
+        
+        logger.warning(f"フラグ更新に失敗したため元に戻しました: {len(changes)}件 ({error})")
+        self.status_label.config(text=f"フラグ更新エラー: {error}")
+        self._request_redraw({message.message_id for message, _, _ in changes})
     
     def _on_reply(self):
         """返信アクション"""
-        if self.selected_messages and self.on_context_menu:
-            self.on_context_menu("reply", self.selected_messages[0])
+        messages = self.selected_messages
+        if messages and self.on_context_menu:
+            self.on_context_menu("reply", messages[0])
     
     def _on_forward(self):
         """転送アクション"""
-        if self.selected_messages and self.on_context_menu:
-            self.on_context_menu("forward", self.selected_messages[0])
+        messages = self.selected_messages
+        if messages and self.on_context_menu:
+            self.on_context_menu("forward", messages[0])
     
-    def _on_delete(self):
-        """削除アクション"""
-        if self.selected_messages and self.on_context_menu:
-            result = messagebox.askyesno(
-                "確認", 
-                f"{len(self.selected_messages)}件のメールを削除しますか？",
-                icon=messagebox.QUESTION
-            )
-            if result:
-                self.on_context_menu("delete", self.selected_messages)
+    def _on_delete(self, confirm: bool = True):
+        """
+        削除アクション
+        
+        Args:
+            confirm: 確認ダイアログを表示するか。1件のみの削除は
+                confirm_single_delete がTrueの場合だけ確認する
+        """
+        # 確認ダイアログ表示中に選択が変わっても、確認した対象を削除する
+        messages = list(self.selected_messages)
+        if not messages or not self.on_context_menu:
+            return
+        
+        if len(messages) == 1 and not self.confirm_single_delete:
+            confirm = False
+        
+        if confirm and not messagebox.askyesno(
+            "確認", 
+            f"{len(messages)}件のメールを削除しますか？",
+            icon=messagebox.QUESTION
+        ):
+            return
+        
+        # 削除は常にリストでまとめて渡し、受け側で1回の要求にできるようにする
+        self.on_context_menu("delete", messages)
 
 
 # ユーティリティ関数
-def create_mail_list(parent, **kwargs) -> MailList:
-    """
-    メールリストコンポーネントを作成します
-    
-    Args:
-        parent: 親ウィジェット
-        **kwargs: MailListのコンストラクタ引数
-        
-    Returns:
-        MailList: 作成されたメールリストコンポーネント
-    """
-    return MailList(parent, **kwargs)
\ No newline at end of file
+# メールリストコンポーネントを作成します（MailListのコンストラクタと同じ引数）
+create_mail_list = MailList
@@ -12,15 +12,26 @@ Created: 2025-07-01
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
-from typing import Optional, List, Dict, Any, Callable
+from tkinter import font as tkfont
+from typing import Optional, List, Dict, Any, Callable, Union
 import threading
 import tempfile
+import subprocess
+import sys
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
 import os
 import webbrowser
 from pathlib import Path
-import html
+from html.parser import HTMLParser
 import re
 from datetime import datetime
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 
 from src.mail.mail_message import MailMessage, MailAttachment, MessageFlag
 from src.utils.logger import get_logger
@@ -28,6 +39,574 @@ from src.utils.logger import get_logger
 # ロガーを取得
 logger = get_logger(__name__)
 
+# 本文中のURL
+_URL_RE = re.compile(r'https?://[^\s<>"]+|www\.[^\s<>"]+')
+
+# 連続する引用行（空白の後に>で始まる行、行末の改行を含む）
+_QUOTE_LINES = r'(?:[^\S\n]*>[^\n]*(?:\n|\Z))+'
+_LEADING_QUOTE_RE = re.compile(_QUOTE_LINES)  # 本文の先頭から始まるもの
+_QUOTE_BLOCK_RE = re.compile(r'\n(' + _QUOTE_LINES + ')')  # 改行の直後から始まるもの
+
+# この文字数以上の本文は、ワーカースレッドで整形してから分割して挿入する
+ASYNC_RENDER_THRESHOLD = 64 * 1024
+
+# 分割挿入時に1回のイベント処理で挿入する上限（セグメント数・文字数）
+RENDER_CHUNK_SEGMENTS = 256
+RENDER_CHUNK_CHARS = 64 * 1024
+
+# 整形済み本文を保持する件数
+BODY_CACHE_SIZE = 32
+
+# 添付ファイルを既定アプリで開くコマンド（Windowsはos.startfileを使うためNone）
+if os.name == 'nt':
+    _OPEN_CMD = None
+elif sys.platform == 'darwin':
+    _OPEN_CMD = 'open'
+else:
+    _OPEN_CMD = 'xdg-open'
+
+# すべて保存で同時に書き込む添付ファイルの数（小さいファイルが多いときの競合を避ける）
+SAVE_ALL_CONCURRENCY = 2
+
+# すべて保存の進行状況を確認する間隔（ミリ秒）
+SAVE_ALL_POLL_MS = 100
+
+# すべて保存の結果に列挙する失敗ファイルの上限
+SAVE_ALL_MAX_LISTED_FAILURES = 10
+
+# この大きさ以上の添付ファイルは、書き込む前にファイル領域をまとめて確保する
+PREALLOCATE_THRESHOLD = 1 << 20
+
+# 添付ファイル書き込み時のos.openフラグ
+# （Windowsで改行を変換しないO_BINARY、子プロセスへ継承しないO_CLOEXEC/O_NOINHERIT）
+_WRITE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                | getattr(os, 'O_BINARY', 0)
+                | getattr(os, 'O_CLOEXEC', 0)
+                | getattr(os, 'O_NOINHERIT', 0))
+
+# 添付ファイル保存ダイアログのファイル種別とタイトル
+_SAVE_FILETYPES = (("すべてのファイル", "*.*"),)
+_TITLE_SAVE_DIR = "保存先ディレクトリを選択"
+
+# 保存するファイル名で使えない文字（パス区切り・Windowsの予約文字・制御文字）を'_'に置き換える変換表
+_FILENAME_TRANSLATION = dict.fromkeys(
+    map(ord, '\\/:*?"<>|' + ''.join(map(chr, range(0x20)))), ord('_'))
+
+# 添付ファイルのデータがない場合の警告
+_WARN_NO_DATA = "添付ファイルのデータが利用できません"
+
+# メール未選択時に本文欄へ表示するテキスト
+_EMPTY_BODY = """🌸 WabiMail メール表示
+
+静かで美しいメール読書体験をお楽しみください。
+
+左のメール一覧からメールを選択すると、
+ここに詳細な内容が表示されます。
+
+侘び寂びの美学に基づいた、
+シンプルで心地よいインターフェースです。
+
+--
+静寂の中の美しさを追求して"""
+
+
+class _HtmlToText(HTMLParser):
+    """
+    HTMLをテキストに変換するパーサー（簡易版）
+    
+    HTMLを1回だけ走査し、改行にあたるタグを改行に置き換えて
+    それ以外のタグを取り除きます。文字参照はパーサーがデコードします。
+    本文全体をつなげた文字列は作らず、確定した行から順に lines へ追加します。
+    """
+    
+    # 開始タグごとに挿入する改行
+    _BREAKS = {'br': '\n', 'p': '\n\n', 'div': '\n'}
+    
+    # 内容を表示しないタグ
+    _HIDDEN = frozenset({'script', 'style'})
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines: List[str] = []  # 前後の空白を除き、連続する空行を1行にまとめた行
+        self._line: List[str] = []  # 作成中の行の断片
+        self._hidden_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        """開始タグ"""
+        if tag in self._HIDDEN:
+            self._hidden_depth += 1
+        elif tag in self._BREAKS:
+            self._append(self._BREAKS[tag])
+    
+    def handle_endtag(self, tag):
+        """終了タグ"""
+        if tag in self._HIDDEN and self._hidden_depth:
+            self._hidden_depth -= 1
+    
+    def handle_data(self, data):
+        """テキスト"""
+        if not self._hidden_depth:
+            self._append(data)
+    
+    def close(self):
+        """解析を終了し、最後の行を確定します"""
+        super().close()
+        self._end_line()
+        if self.lines and not self.lines[-1]:
+            self.lines.pop()
+    
+    def _append(self, text: str):
+        """
+        テキストを追加し、改行までの行を確定します
+        
+        Args:
+            text: 追加するテキスト
+        """
+        pieces = text.split('\n')
+        self._line.append(pieces[0])
+        for piece in pieces[1:]:
+            self._end_line()
+            self._line.append(piece)
+    
+    def _end_line(self):
+        """作成中の行を確定します"""
+        line = ''.join(self._line).strip()
+        self._line = []
+        # 先頭の空行は出さず、連続する空行は1行にまとめる
+        if line or (self.lines and self.lines[-1]):
+            self.lines.append(line)
+
+
+def _html_to_lines(html_text: str) -> List[str]:
+    """
+    HTMLをテキストの行に変換します（簡易版）
+    
+    Args:
+        html_text: HTML文字列
+        
+    Returns:
+        List[str]: 変換されたテキストの行
+    """
+    if not html_text:
+        return []
+    
+    parser = _HtmlToText()
+    parser.feed(html_text)
+    parser.close()
+    return parser.lines
+
+
+def _message_html_text(message: MailMessage) -> str:
+    """
+    メッセージのHTML本文をテキストに変換した結果を取得します
+    
+    変換結果はメッセージに保持し、HTML本文が差し替えられるまで再利用します。
+    
+    Args:
+        message: 対象メッセージ
+        
+    Returns:
+        str: 変換されたテキスト
+    """
+    body_html = message.body_html
+    cached = getattr(message, "_html_text", None)
+    if cached is None or cached[0] is not body_html:
+        cached = (body_html, '\n'.join(_html_to_lines(body_html)))
+        message._html_text = cached
+    return cached[1]
+
+
+def _quote_blocks(text: str):
+    """
+    本文中の連続する引用行の範囲を順に返します
+    
+    Args:
+        text: 本文テキスト
+        
+    Yields:
+        tuple: 引用行の (開始位置, 終了位置)
+    """
+    match = _LEADING_QUOTE_RE.match(text)
+    if match:
+        yield match.span()
+    for match in _QUOTE_BLOCK_RE.finditer(text, match.end() if match else 0):
+        yield match.span(1)
+
+
+def _text_segments(text: str) -> List[tuple]:
+    """
+    テキスト本文を表示用のセグメントに分割します
+    
+    引用行（>で始まる行）とURLを検出し、それぞれのタグを付けます。
+    行ごとに分割せず本文全体を正規表現で走査するため、
+    連続する引用行や、引用・URLを含まない部分はそれぞれ1つのセグメントになります。
+    
+    Args:
+        text: 本文テキスト
+        
+    Returns:
+        List[tuple]: (文字列, タグ, URL) のリスト。タグ・URLがない場合はNone
+    """
+    segments = []
+    pos = 0
+    for quote_start, quote_end in chain(_quote_blocks(text), ((len(text), len(text)),)):
+        # 引用行の前の部分からURLを検出
+        for match in _URL_RE.finditer(text, pos, quote_start):
+            # URL前のテキスト
+            if match.start() > pos:
+                segments.append((text[pos:match.start()], None, None))
+            
+            # URL部分をリンクとして挿入
+            url = match.group()
+            if not url.startswith('http'):
+                url = 'http://' + url
+            segments.append((match.group(), "link", url))
+            
+            pos = match.end()
+        
+        # 残りのテキスト
+        if pos < quote_start:
+            segments.append((text[pos:quote_start], None, None))
+        
+        # 引用行
+        if quote_start < quote_end:
+            segments.append((text[quote_start:quote_end], "quote", None))
+        pos = quote_end
+    
+    return segments
+
+
+def _text_pos(index: str) -> tuple:
+    """
+    Textウィジェットの位置（"行.列"）を比較できるタプルに変換します
+    
+    Args:
+        index: Textウィジェットの位置
+        
+    Returns:
+        tuple: (行, 列)
+    """
+    line, col = index.split(".")
+    return int(line), int(col)
+
+
+def _prepare_body_segments(message: MailMessage, show_html: bool) -> List[tuple]:
+    """
+    本文を表示用のセグメントに変換します
+    
+    ウィジェットに触れないため、ワーカースレッドからも呼び出せます。
+    
+    Args:
+        message: 表示するメッセージ
+        show_html: HTML本文を表示するか
+        
+    Returns:
+        List[tuple]: (文字列, タグ, URL) のリスト
+    """
+    if show_html and message.body_html:
+        # HTML表示モードであることを示すマークを先頭に付ける
+        # 将来的にはHTMLViewerウィジェットを使用
+        return [("[HTML表示モード]\n\n", "header", None)] + _text_segments(_message_html_text(message))
+    
+    return _text_segments(message.body_text or "[本文なし]")
+
+
+@dataclass(slots=True)
+class _HeaderView:
+    """メッセージのヘッダー表示用に整形した文字列"""
+    message: MailMessage
+    subject: str
+    sender: str
+    recipients: str
+    date: str
+    status: str
+    detailed_text: Optional[str] = None  # 詳細ヘッダー（初めて表示するときに作成）
+
+
+@lru_cache(maxsize=1024)
+def _format_file_size(size: int) -> str:
+    """
+    ファイルサイズを人間が読みやすい形式にフォーマットします
+    
+    Args:
+        size: ファイルサイズ（バイト）
+        
+    Returns:
+        str: フォーマットされたサイズ文字列
+    """
+    if size < 1 << 10:
+        return f"{size} B"
+    elif size < 1 << 20:
+        return f"{size / (1 << 10):.1f} KB"
+    elif size < 1 << 30:
+        return f"{size / (1 << 20):.1f} MB"
+    else:
+        return f"{size / (1 << 30):.1f} GB"
+
+
+def _safe_filename(filename: str) -> str:
+    """
+    添付ファイル名から保存に使えるファイル名を作成します
+    
+    ディレクトリ部分を取り除き、保存先の外へ書き込めないようにします。
+    残った名前に含まれるファイル名に使えない文字は'_'に置き換えます。
+    
+    Args:
+        filename: 添付ファイル名
+        
+    Returns:
+        str: ディレクトリを含まないファイル名
+    """
+    name = os.path.basename(filename).translate(_FILENAME_TRANSLATION)
+    if name in ("", ".", ".."):
+        return "attachment"
+    return name
+
+
+def _preallocate(fd: int, size: int):
+    """
+    書き込み前にファイルの領域を確保します
+    
+    書き込みの途中でファイルサイズが何度も伸びるのを避けるためのもので、
+    確保できない場合（対応していないファイルシステムなど）はそのまま書き込みます。
+    
+    Args:
+        fd: 書き込み先のファイルディスクリプタ
+        size: 書き込むバイト数
+    """
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(fd, 0, size)
+        elif os.name == 'nt':
+            # Windowsではファイルの末尾を先に設定しておく（SetEndOfFile相当）
+            os.ftruncate(fd, size)
+    except OSError as e:
+        logger.debug(f"ファイル領域の事前確保をスキップしました: {e}")
+
+
+def _unique_filenames(filenames: List[str]) -> List[str]:
+    """
+    同じ名前が重ならないようにファイル名を調整します
+    
+    2つ目以降の同名ファイルには「名前 (1).拡張子」のように番号を付けます。
+    保存先が大文字・小文字を区別しないファイルシステム（Windows・macOSの既定）でも
+    重ならないよう、OSによらず大文字・小文字違いも同名として扱います。
+    
+    Args:
+        filenames: ファイル名のリスト
+        
+    Returns:
+        List[str]: 互いに重ならないファイル名のリスト（順序は元のまま）
+    """
+    used = set()
+    unique = []
+    for name in filenames:
+        stem, ext = os.path.splitext(name)
+        candidate = name
+        n = 1
+        while candidate.casefold() in used:
+            candidate = f"{stem} ({n}){ext}"
+            n += 1
+        used.add(candidate.casefold())
+        unique.append(candidate)
+    return unique
+
+
+def _write_file(path: str, data: Union[bytes, bytearray, memoryview]):
+    """
+    ファイルにデータを書き込みます
+    
+    ウィジェットに触れないため、ワーカースレッドからも呼び出せます。
+    書き込みに失敗した場合は例外がそのまま送出されます。
+    
+    バッファ付きファイルオブジェクトを介さず、データをそのままos.writeに渡します。
+    bytes以外のバイト列（bytearray、memoryviewなど）もコピーせずに書き込みます。
+    
+    Args:
+        path: 書き込み先のパス
+        data: 書き込むデータ
+    """
+    # 要素単位ではなくバイト単位で書き込み位置を進めるため、1バイト単位のビューにする
+    view = memoryview(data).cast('B')
+    size = view.nbytes
+    
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        if size >= PREALLOCATE_THRESHOLD:
+            _preallocate(fd, size)
+        
+        written = 0
+        while written < size:
+            written += os.write(fd, view[written:])
+    finally:
+        os.close(fd)
+
+
+def _open_with_default_app(path: str):
+    """
+    ファイルをシステムの既定アプリケーションで開きます
+    
+    Args:
+        path: 開くファイルのパス
+    """
+    if _OPEN_CMD is None:  # Windows
+        os.startfile(path)
+    else:  # macOS, Linux
+        # シェルを介さずに起動し、終了は待たない（ファイル名の引用符も問題にならない）
+        subprocess.Popen([_OPEN_CMD, path], close_fds=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def _write_and_open(path: str, data: bytes):
+    """
+    ファイルに書き込んでから既定アプリケーションで開きます（ワーカースレッドで実行）
+    
+    Args:
+        path: 書き込み先のパス
+        data: 書き込むデータ
+    """
+    _write_file(path, data)
+    _open_with_default_app(path)
+
+
+class _SaveAllTask:
+    """
+    すべて保存の書き込みを順に進めるタスク
+    
+    同時に書き込むのは最大concurrency件で、1件終わるごとに次の書き込みを投入します。
+    進行状況はメインスレッドから参照され、中止すると未投入の書き込みは行いません。
+    """
+    
+    def __init__(self, pool: ThreadPoolExecutor, jobs: list, concurrency: int = SAVE_ALL_CONCURRENCY):
+        """
+        Args:
+            pool: 書き込みを実行するスレッドプール
+            jobs: (書き込み先のパス, データ) のリスト
+            concurrency: 同時に書き込む件数
+        """
+        self.total = len(jobs)
+        self.saved = 0
+        self.finished = 0
+        self.failures: List[str] = []  # 保存できなかったファイル（「ファイル名: エラー」）
+        self._submitted = 0
+        self._exhausted = False
+        self._pending = iter(jobs)
+        self._pool = pool
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        
+        for _ in range(concurrency):
+            self._submit_next()
+    
+    @property
+    def cancelled(self) -> bool:
+        """中止されたか"""
+        return self._cancel_event.is_set()
+    
+    @property
+    def done(self) -> bool:
+        """投入した書き込みがすべて終わり、これ以上投入しないか"""
+        with self._lock:
+            return (self._exhausted or self.cancelled) and self.finished == self._submitted
+    
+    def cancel(self):
+        """未投入の書き込みを中止します"""
+        self._cancel_event.set()
+    
+    def _submit_next(self):
+        """次の書き込みを投入します"""
+        with self._lock:
+            job = None if self.cancelled else next(self._pending, None)
+            if job is None:
+                self._exhausted = True
+                return
+            self._submitted += 1
+        
+        path, data = job
+        try:
+            future = self._pool.submit(_write_file, path, data)
+        except RuntimeError:
+            # ビューア破棄でプールが停止済み
+            with self._lock:
+                self._submitted -= 1
+                self._exhausted = True
+            return
+        future.add_done_callback(lambda f: self._on_write_done(path, f))
+    
+    def _on_write_done(self, path: str, future):
+        """書き込み完了時の処理（ワーカースレッドから呼ばれる）"""
+        error = None if future.cancelled() else future.exception()
+        if error is not None:
+            logger.error(f"添付ファイル保存エラー: {error}")
+        
+        with self._lock:
+            self.finished += 1
+            if error is not None:
+                self.failures.append(f"{os.path.basename(path)}: {error}")
+            elif not future.cancelled():
+                self.saved += 1
+        self._submit_next()
+
+
+def _build_header_view(message: MailMessage) -> _HeaderView:
+    """
+    メッセージのヘッダー表示用の文字列を作成します
+    
+    Args:
+        message: 対象メッセージ
+        
+    Returns:
+        _HeaderView: 整形済みのヘッダー情報
+    """
+    # 宛先
+    recipients = ", ".join(message.recipients) if message.recipients else "[宛先不明]"
+    if len(recipients) > 60:
+        recipients = recipients[:57] + "..."
+    
+    return _HeaderView(
+        message=message,
+        subject=message.subject or "[件名なし]",
+        sender=message.sender or "[送信者不明]",
+        recipients=recipients,
+        date=message.get_display_date().strftime("%Y年%m月%d日 %H:%M:%S"),
+        status=f"件名: {message.subject}",
+    )
+
+
+def _format_detailed_headers(message: MailMessage) -> str:
+    """
+    詳細ヘッダーの表示用テキストを作成します
+    
+    Args:
+        message: 対象メッセージ
+        
+    Returns:
+        str: 詳細ヘッダーのテキスト
+    """
+    header_text = ""
+    
+    # 基本ヘッダー
+    if message.message_id:
+        header_text += f"Message-ID: {message.message_id}\n"
+    if message.in_reply_to:
+        header_text += f"In-Reply-To: {message.in_reply_to}\n"
+    if message.references:
+        header_text += f"References: {' '.join(message.references)}\n"
+    if message.reply_to:
+        header_text += f"Reply-To: {message.reply_to}\n"
+    if message.cc_recipients:
+        header_text += f"CC: {', '.join(message.cc_recipients)}\n"
+    if message.priority != "normal":
+        header_text += f"Priority: {message.priority}\n"
+    
+    # 生ヘッダー情報
+    if message.raw_headers:
+        header_text += "\n--- 生ヘッダー ---\n"
+        for key, value in message.raw_headers.items():
+            header_text += f"{key}: {value}\n"
+    
+    return header_text
+
 
 class MailViewer(ttk.Frame):
     """
@@ -85,8 +664,33 @@ class MailViewer(ttk.Frame):
         self.text_widget = None
         self.html_widget = None
         self.attachments_frame = None
+        self.attachments_tree = None
+        self.detailed_header_frame = None
+        self.detailed_header_text = None
         self.status_label = None
         
+        # 本文の描画
+        self._render_token = 0  # 描画要求の通し番号（古い結果の破棄用）
+        self._url_ranges: List[tuple] = []  # 本文中のリンクの (開始位置, 終了位置, URL)、開始位置順
+        self._displayed_body_key: Optional[tuple] = None  # 本文欄に表示中の (メッセージID, HTML表示)
+        self._render_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mail-viewer-render")
+        self._body_cache: "OrderedDict[tuple, list]" = OrderedDict()  # (メッセージID, HTML表示) → セグメント
+        
+        # 表示中のメッセージのヘッダー（表示切り替え時に再利用）
+        self._last_header_view: Optional[_HeaderView] = None
+        self._dirty = True  # 表示中のメッセージの表示を作り直す必要があるか
+        
+        # ズーム（スライダー操作中は反映を遅らせる）
+        self._zoom_after_id = None
+        
+        # 添付ファイルの入出力
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mail-viewer-io")
+        self._tmp_dir: Optional[tempfile.TemporaryDirectory] = None  # 添付ファイルを開くための一時ディレクトリ
+        self._temp_files: Dict[str, bytes] = {}  # 一時ファイルのパス → 書き込んだデータ
+        self._selected_attachment: Optional[MailAttachment] = None  # 添付ファイル一覧で選択中の添付ファイル
+        self._save_all_task: Optional[_SaveAllTask] = None  # 実行中のすべて保存
+        self._save_all_after_id = None
+        
         # 侘び寂びスタイルの設定
         self._setup_wabi_sabi_style()
         
@@ -95,6 +699,27 @@ class MailViewer(ttk.Frame):
         
         logger.info("メール表示コンポーネントを初期化しました")
     
+    def destroy(self):
+        """
+        コンポーネントを破棄します
+        """
+        self._render_executor.shutdown(wait=False, cancel_futures=True)
+        if self._zoom_after_id is not None:
+            self.after_cancel(self._zoom_after_id)
+            self._zoom_after_id = None
+        if self._save_all_task is not None:
+            self._save_all_task.cancel()
+            self._save_all_task = None
+        if self._save_all_after_id is not None:
+            self.after_cancel(self._save_all_after_id)
+            self._save_all_after_id = None
+        self._io_pool.shutdown(wait=False)
+        if self._tmp_dir is not None:
+            self._tmp_dir.cleanup()
+            self._tmp_dir = None
+            self._temp_files.clear()
+        super().destroy()
+    
     def _setup_wabi_sabi_style(self):
         """
         侘び寂びの美学に基づいたスタイルを設定します
@@ -120,6 +745,12 @@ class MailViewer(ttk.Frame):
             'mono': ('Consolas', 9),
             'small': ('Yu Gothic UI', 8)
         }
+        
+        # 名前付きフォント（設定のたびにフォント指定を解釈させない）
+        self.font_objs = {name: tkfont.Font(font=spec) for name, spec in self.fonts.items()}
+        self.font_objs['emphasis'] = tkfont.Font(font=self.fonts['body'] + ('italic',))
+        # 本文テキスト用（ズームでサイズだけを変更する）
+        self.font_objs['text'] = tkfont.Font(font=self.fonts['body'])
     
     def _create_widgets(self):
         """
@@ -138,8 +769,8 @@ class MailViewer(ttk.Frame):
         # メール本文エリア
         self._create_content_area(main_container)
         
-        # 添付ファイルエリア
-        self._create_attachments_area(main_container)
+        # 添付ファイルエリア（添付ファイルのあるメールを初めて表示するときに作成）
+        self._attachments_parent = main_container
         
         # ステータスバー
         self._create_status_bar(main_container)
@@ -165,7 +796,7 @@ class MailViewer(ttk.Frame):
         # 件名表示
         self.subject_label = tk.Label(header_content, 
                                      text="件名が表示されます", 
-                                     font=self.fonts['header'],
+                                     font=self.font_objs['header'],
                                      bg=self.colors['bg'],
                                      fg=self.colors['text'],
                                      anchor=tk.W)
@@ -180,12 +811,12 @@ class MailViewer(ttk.Frame):
         sender_frame.pack(fill=tk.X, pady=1)
         
         tk.Label(sender_frame, text="差出人:", 
-                font=self.fonts['small'], 
+                font=self.font_objs['small'], 
                 bg=self.colors['bg'], fg=self.colors['text']).pack(side=tk.LEFT)
         
         self.sender_label = tk.Label(sender_frame, 
                                     text="送信者が表示されます",
-                                    font=self.fonts['body'],
+                                    font=self.font_objs['body'],
                                     bg=self.colors['bg'], fg=self.colors['text'],
                                     anchor=tk.W)
         self.sender_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0))
@@ -195,12 +826,12 @@ class MailViewer(ttk.Frame):
         recipient_frame.pack(fill=tk.X, pady=1)
         
         tk.Label(recipient_frame, text="宛先:", 
-                font=self.fonts['small'], 
+                font=self.font_objs['small'], 
                 bg=self.colors['bg'], fg=self.colors['text']).pack(side=tk.LEFT)
         
         self.recipient_label = tk.Label(recipient_frame, 
                                        text="宛先が表示されます",
-                                       font=self.fonts['body'],
+                                       font=self.font_objs['body'],
                                        bg=self.colors['bg'], fg=self.colors['text'],
                                        anchor=tk.W)
         self.recipient_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0))
@@ -210,22 +841,31 @@ class MailViewer(ttk.Frame):
         meta_frame.pack(fill=tk.X, pady=1)
         
         tk.Label(meta_frame, text="日時:", 
-                font=self.fonts['small'], 
+                font=self.font_objs['small'], 
                 bg=self.colors['bg'], fg=self.colors['text']).pack(side=tk.LEFT)
         
         self.date_label = tk.Label(meta_frame, 
                                   text="日時が表示されます",
-                                  font=self.fonts['body'],
+                                  font=self.font_objs['body'],
                                   bg=self.colors['bg'], fg=self.colors['text'],
                                   anchor=tk.W)
         self.date_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0))
         
-        # 詳細ヘッダー表示用（オプション）
-        self.detailed_header_frame = ttk.Frame(header_content)
+        # 詳細ヘッダー表示用（オプション、初めて表示するときに作成）
+        self._header_content = header_content
+    
+    def _ensure_detailed_header_widget(self):
+        """
+        詳細ヘッダー表示用のウィジェットがなければ作成します
+        """
+        if self.detailed_header_text is not None:
+            return
+        
+        self.detailed_header_frame = ttk.Frame(self._header_content)
         self.detailed_header_text = scrolledtext.ScrolledText(
             self.detailed_header_frame,
             height=6, width=50,
-            font=self.fonts['mono'],
+            font=self.font_objs['mono'],
             bg=self.colors['accent'],
             fg=self.colors['text'],
             wrap=tk.WORD,
@@ -316,7 +956,7 @@ class MailViewer(ttk.Frame):
         # テキスト表示用ScrolledText
         self.text_widget = scrolledtext.ScrolledText(
             self.content_frame,
-            font=self.fonts['body'],
+            font=self.font_objs['text'],
             bg=self.colors['bg'],
             fg=self.colors['text'],
             wrap=tk.WORD,
@@ -339,28 +979,28 @@ class MailViewer(ttk.Frame):
         """
         # 各種テキストスタイルを定義
         self.text_widget.tag_configure("header", 
-                                      font=self.fonts['header'],
+                                      font=self.font_objs['header'],
                                       foreground=self.colors['text'])
         
         self.text_widget.tag_configure("link", 
-                                      font=self.fonts['body'],
+                                      font=self.font_objs['body'],
                                       foreground=self.colors['link'],
                                       underline=True)
         
         self.text_widget.tag_configure("quote", 
-                                      font=self.fonts['body'],
+                                      font=self.font_objs['body'],
                                       foreground="#666666",
                                       lmargin1=20, lmargin2=20)
         
         self.text_widget.tag_configure("code", 
-                                      font=self.fonts['mono'],
+                                      font=self.font_objs['mono'],
                                       background=self.colors['accent'])
         
         self.text_widget.tag_configure("emphasis", 
-                                      font=(self.fonts['body'][0], self.fonts['body'][1], 'italic'))
+                                      font=self.font_objs['emphasis'])
         
         self.text_widget.tag_configure("strong", 
-                                      font=self.fonts['header'])
+                                      font=self.font_objs['header'])
         
         # リンククリックのバインド
         self.text_widget.tag_bind("link", "<Button-1>", self._on_link_click)
@@ -421,6 +1061,14 @@ class MailViewer(ttk.Frame):
                                          command=self._on_save_all_attachments)
         self.save_all_button.pack(side=tk.LEFT, padx=(0, 4))
         
+        # すべて保存の進行状況と中止ボタン（保存中のみ表示）
+        self.save_all_progress = ttk.Progressbar(attachments_actions, 
+                                                 length=120, 
+                                                 mode="determinate")
+        self.cancel_save_all_button = ttk.Button(attachments_actions, 
+                                                text="✕ 中止", 
+                                                command=self._on_cancel_save_all)
+        
         self.open_attachment_button = ttk.Button(attachments_actions, 
                                                text="📂 開く", 
                                                command=self._on_open_attachment)
@@ -428,6 +1076,14 @@ class MailViewer(ttk.Frame):
         
         # ダブルクリックイベント
         self.attachments_tree.bind("<Double-1>", self._on_attachment_double_click)
+        self.attachments_tree.bind("<<TreeviewSelect>>", self._on_attachment_select)
+    
+    def _ensure_attachments_widget(self):
+        """
+        添付ファイル表示エリアがなければ作成します
+        """
+        if self.attachments_tree is None:
+            self._create_attachments_area(self._attachments_parent)
     
     def _create_status_bar(self, parent):
         """
@@ -453,14 +1109,21 @@ class MailViewer(ttk.Frame):
         Args:
             message: 表示するメールメッセージ
         """
+        # 表示中のメッセージが変更なく再指定された場合は何もしない
+        if message is self.current_message and not self._dirty:
+            return
+        
         self.current_message = message
         
         if not message:
+            self._body_cache.clear()
             self._show_empty_message()
+            self._dirty = False
             return
         
         try:
-            # ヘッダー情報を表示
+            # ヘッダー情報を表示（表示切り替え時はこの整形結果を再利用する）
+            self._last_header_view = _build_header_view(message)
             self._display_header_info(message)
             
             # 本文を表示
@@ -479,6 +1142,8 @@ class MailViewer(ttk.Frame):
             if not message.is_read():
                 message.mark_as_read()
             
+            self._dirty = False
+            
             logger.debug(f"メッセージを表示しました: {message.subject}")
             
         except Exception as e:
@@ -492,31 +1157,39 @@ class MailViewer(ttk.Frame):
         Args:
             message: 表示するメッセージ
         """
-        # 件名
-        subject = message.subject or "[件名なし]"
-        self.subject_label.config(text=subject)
-        
-        # 送信者
-        sender = message.sender or "[送信者不明]"
-        self.sender_label.config(text=sender)
+        view = self._get_header_view(message)
         
-        # 宛先
-        recipients = ", ".join(message.recipients) if message.recipients else "[宛先不明]"
-        if len(recipients) > 60:
-            recipients = recipients[:57] + "..."
-        self.recipient_label.config(text=recipients)
-        
-        # 日時
-        date_str = message.get_display_date().strftime("%Y年%m月%d日 %H:%M:%S")
-        self.date_label.config(text=date_str)
+        # 件名・送信者・宛先・日時
+        self.subject_label.config(text=view.subject)
+        self.sender_label.config(text=view.sender)
+        self.recipient_label.config(text=view.recipients)
+        self.date_label.config(text=view.date)
         
         # 詳細ヘッダー（オプション）
         if self.show_headers.get():
             self._display_detailed_headers(message)
             self.detailed_header_frame.pack(fill=tk.X, pady=(8, 0))
-        else:
+        elif self.detailed_header_frame is not None:
             self.detailed_header_frame.pack_forget()
     
+    def _get_header_view(self, message: MailMessage) -> _HeaderView:
+        """
+        メッセージのヘッダー表示用の文字列を取得します
+        
+        表示中のメッセージであれば、display_messageで作成したものを再利用します。
+        
+        Args:
+            message: 対象メッセージ
+            
+        Returns:
+            _HeaderView: 整形済みのヘッダー情報
+        """
+        view = self._last_header_view
+        if view is None or view.message is not message:
+            view = _build_header_view(message)
+            self._last_header_view = view
+        return view
+    
     def _display_detailed_headers(self, message: MailMessage):
         """
         詳細ヘッダー情報を表示します
@@ -524,150 +1197,174 @@ class MailViewer(ttk.Frame):
         Args:
             message: 表示するメッセージ
         """
-        self.detailed_header_text.config(state=tk.NORMAL)
-        self.detailed_header_text.delete(1.0, tk.END)
-        
-        header_text = ""
-        
-        # 基本ヘッダー
-        if message.message_id:
-            header_text += f"Message-ID: {message.message_id}\n"
-        if message.in_reply_to:
-            header_text += f"In-Reply-To: {message.in_reply_to}\n"
-        if message.references:
-            header_text += f"References: {' '.join(message.references)}\n"
-        if message.reply_to:
-            header_text += f"Reply-To: {message.reply_to}\n"
-        if message.cc_recipients:
-            header_text += f"CC: {', '.join(message.cc_recipients)}\n"
-        if message.priority != "normal":
-            header_text += f"Priority: {message.priority}\n"
-        
-        # 生ヘッダー情報
-        if message.raw_headers:
-            header_text += "\n--- 生ヘッダー ---\n"
-            for key, value in message.raw_headers.items():
-                header_text += f"{key}: {value}\n"
-        
-        self.detailed_header_text.insert(tk.END, header_text)
-        self.detailed_header_text.config(state=tk.DISABLED)
+        view = self._get_header_view(message)
+        if view.detailed_text is None:
+            view.detailed_text = _format_detailed_headers(message)
+        
+        self._ensure_detailed_header_widget()
+        with self._editable(self.detailed_header_text):
+            self.detailed_header_text.delete(1.0, tk.END)
+            self.detailed_header_text.insert(tk.END, view.detailed_text)
     
     def _display_body_content(self, message: MailMessage):
         """
         メール本文を表示します
         
+        大きな本文はワーカースレッドで整形し、イベントループを止めないよう
+        少しずつ挿入します。
+        
         Args:
             message: 表示するメッセージ
         """
-        self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.delete(1.0, tk.END)
+        show_html = self.show_html.get()
+        key = (message.message_id, show_html)
+        if key == self._displayed_body_key:
+            # 同じ本文を表示中（または描画中）であれば消して入れ直さない
+            return
+        
+        self._reset_body_render()
+        self._displayed_body_key = key
+        token = self._render_token
         
-        if self.show_html.get() and message.body_html:
-            # HTML表示
-            self._display_html_content(message.body_html)
+        segments = self._body_cache.get(key)
+        if segments is not None:
+            self._body_cache.move_to_end(key)
+            limit = len(segments) > RENDER_CHUNK_SEGMENTS
         else:
-            # テキスト表示
-            self._display_text_content(message.body_text or "[本文なし]")
+            body_html = message.body_html if show_html else ""
+            body_text = message.body_text
+            
+            if len(body_html or body_text) >= ASYNC_RENDER_THRESHOLD:
+                # 前の本文を消し、整形が終わるのを待つ
+                with self._editable(self.text_widget):
+                    self.text_widget.delete(1.0, tk.END)
+                future = self._render_executor.submit(_prepare_body_segments, message, show_html)
+                future.add_done_callback(lambda f: self._post_segments(token, key, f))
+                return
+            
+            segments = _prepare_body_segments(message, show_html)
+            self._cache_segments(key, segments)
+            limit = False
         
-        self.text_widget.config(state=tk.DISABLED)
+        # 前の本文の削除と新しい本文の挿入を1回の編集で行う
+        self._flush_segments(token, iter(segments), limit=limit, clear=True)
     
-    def _display_text_content(self, text: str):
+    def _reset_body_render(self):
         """
-        テキスト本文を表示します
+        描画中の本文の続きを破棄し、前の本文のリンク情報を解放します
         
-        Args:
-            text: 表示するテキスト
+        本文欄の内容は差し替わるため、表示中の本文の記録もクリアします。
         """
-        # URLの検出とリンク化
-        url_pattern = r'https?://[^\s<>"]+|www\.[^\s<>"]+'
-        
-        lines = text.split('\n')
-        for line_num, line in enumerate(lines):
-            # 引用行の検出（>で始まる行）
-            if line.strip().startswith('>'):
-                self.text_widget.insert(tk.END, line, "quote")
-            else:
-                # URLの検出
-                last_end = 0
-                for match in re.finditer(url_pattern, line):
-                    # URL前のテキスト
-                    if match.start() > last_end:
-                        self.text_widget.insert(tk.END, line[last_end:match.start()])
-                    
-                    # URL部分をリンクとして挿入
-                    url = match.group()
-                    if not url.startswith('http'):
-                        url = 'http://' + url
-                    
-                    start_index = self.text_widget.index(tk.END)
-                    self.text_widget.insert(tk.END, match.group(), "link")
-                    end_index = self.text_widget.index(tk.END)
-                    
-                    # URLを関連付け
-                    self.text_widget.tag_add(f"url_{match.start()}", start_index, end_index)
-                    self.text_widget.tag_bind(f"url_{match.start()}", "<Button-1>", 
-                                            lambda e, u=url: self._open_url(u))
-                    
-                    last_end = match.end()
-                
-                # 残りのテキスト
-                if last_end < len(line):
-                    self.text_widget.insert(tk.END, line[last_end:])
-            
-            # 改行（最後の行以外）
-            if line_num < len(lines) - 1:
-                self.text_widget.insert(tk.END, '\n')
+        self._render_token += 1
+        self._url_ranges = []
+        self._displayed_body_key = None
     
-    def _display_html_content(self, html: str):
+    @contextmanager
+    def _editable(self, widget: tk.Text):
         """
-        HTML本文を表示します（簡易版）
+        読み取り専用のテキストウィジェットを、ブロックの間だけ編集可能にします
         
         Args:
-            html: 表示するHTML
+            widget: 対象のテキストウィジェット
         """
-        # 簡易的なHTML→テキスト変換
-        # 将来的にはHTMLViewerウィジェットを使用
+        widget.config(state=tk.NORMAL)
+        try:
+            yield widget
+        finally:
+            widget.config(state=tk.DISABLED)
+    
+    def _cache_segments(self, key: tuple, segments: list):
+        """
+        整形済みの本文セグメントを保持します
         
-        # HTMLタグを除去してテキスト化
-        text = self._html_to_text(html)
-        self._display_text_content(text)
+        Args:
+            key: (メッセージID, HTML表示)
+            segments: 本文のセグメント
+        """
+        self._body_cache[key] = segments
+        self._body_cache.move_to_end(key)
+        while len(self._body_cache) > BODY_CACHE_SIZE:
+            self._body_cache.popitem(last=False)
+    
+    def _post_segments(self, token: int, key: tuple, future):
+        """
+        整形した本文をメインスレッドへ渡します（ワーカースレッドから呼ばれる）
         
-        # HTML表示モードであることを示すマーク
-        self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.insert(1.0, "[HTML表示モード]\n\n", "header")
-        self.text_widget.config(state=tk.DISABLED)
+        Args:
+            token: 描画要求の通し番号
+            key: (メッセージID, HTML表示)
+            future: 整形処理のFuture
+        """
+        try:
+            self.after(0, self._start_segments, token, key, future)
+        except (RuntimeError, tk.TclError):
+            # ウィジェット破棄後は何もしない
+            pass
     
-    def _html_to_text(self, html: str) -> str:
+    def _start_segments(self, token: int, key: tuple, future):
         """
-        HTMLをテキストに変換します（簡易版）
+        整形した本文の挿入を開始します
         
         Args:
-            html: HTML文字列
-            
-        Returns:
-            str: 変換されたテキスト
+            token: 描画要求の通し番号
+            key: (メッセージID, HTML表示)
+            future: 整形処理のFuture
         """
-        if not html:
-            return ""
+        if future.cancelled():
+            return
+        
+        try:
+            segments = future.result()
+        except Exception as e:
+            if token == self._render_token:
+                logger.error(f"本文整形エラー: {e}")
+                self._show_error_message(f"本文の表示中にエラーが発生しました: {e}")
+            return
+        
+        # 表示が切り替わった後でも、整形結果は次回のために保持する
+        self._cache_segments(key, segments)
+        if token != self._render_token:
+            return
         
-        # HTMLエンティティをデコード
-        text = html.unescape(html)
+        self._flush_segments(token, iter(segments))
+    
+    def _flush_segments(self, token: int, segments, limit: bool = True, clear: bool = False):
+        """
+        本文のセグメントを挿入します
         
-        # 基本的なHTMLタグを処理
-        text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'<p\s*[^>]*>', '\n\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</p>', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'<div\s*[^>]*>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</div>', '', text, flags=re.IGNORECASE)
+        limitがTrueの場合は上限まで挿入し、残りは次のイベント処理で続けます。
         
-        # すべてのHTMLタグを除去
-        text = re.sub(r'<[^>]+>', '', text)
+        Args:
+            token: 描画要求の通し番号
+            segments: (文字列, タグ, URL) のイテレーター
+            limit: 1回に挿入する量を制限するか
+            clear: 挿入の前に本文欄を空にするか
+        """
+        if token != self._render_token:
+            return
         
-        # 連続する空白・改行を整理
-        text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)
-        text = re.sub(r'^\s+|\s+$', '', text, flags=re.MULTILINE)
+        insert = self.text_widget.insert
+        chars = 0
+        count = 0
         
-        return text.strip()
+        with self._editable(self.text_widget):
+            if clear:
+                self.text_widget.delete(1.0, tk.END)
+            
+            for text, tag, url in segments:
+                if url is not None:
+                    # 位置を記録し、クリック時は共通の"link"タグのハンドラーからURLを引く
+                    line, col = _text_pos(self.text_widget.index("end-1c"))
+                    insert(tk.END, text, tag)
+                    self._url_ranges.append(((line, col), (line, col + len(text)), url))
+                else:
+                    insert(tk.END, text, tag or ())
+                
+                chars += len(text)
+                count += 1
+                if limit and (count >= RENDER_CHUNK_SEGMENTS or chars >= RENDER_CHUNK_CHARS):
+                    self.after(0, self._flush_segments, token, segments)
+                    return
     
     def _display_attachments(self, message: MailMessage):
         """
@@ -676,48 +1373,31 @@ class MailViewer(ttk.Frame):
         Args:
             message: 表示するメッセージ
         """
-        # 既存の添付ファイルリストをクリア
-        for item in self.attachments_tree.get_children():
-            self.attachments_tree.delete(item)
+        self._selected_attachment = None
         
         if message.has_attachments():
+            self._ensure_attachments_widget()
+            
+            # 行の内容を先にまとめて作成
+            rows = [(attachment.filename, attachment.content_type, _format_file_size(attachment.size))
+                    for attachment in message.attachments]
+            
+            # 既存の添付ファイルリストを一度にクリア
+            children = self.attachments_tree.get_children()
+            if children:
+                self.attachments_tree.delete(*children)
+            
             # 添付ファイルフレームを表示
             self.attachments_frame.pack(fill=tk.X, pady=(0, 8))
             
-            # 各添付ファイルを追加
-            for attachment in message.attachments:
-                # ファイルサイズを人間が読みやすい形式に変換
-                size_str = self._format_file_size(attachment.size)
-                
-                # アイテムを追加
-                self.attachments_tree.insert("", "end", values=(
-                    attachment.filename,
-                    attachment.content_type,
-                    size_str
-                ))
-        else:
+            # 各添付ファイルを追加（行IDは添付ファイルの位置。同名ファイルも区別できる）
+            insert = self.attachments_tree.insert
+            for i, values in enumerate(rows):
+                insert("", "end", iid=str(i), values=values)
+        elif self.attachments_frame is not None:
             # 添付ファイルがない場合は非表示
             self.attachments_frame.pack_forget()
     
-    def _format_file_size(self, size: int) -> str:
-        """
-        ファイルサイズを人間が読みやすい形式にフォーマットします
-        
-        Args:
-            size: ファイルサイズ（バイト）
-            
-        Returns:
-            str: フォーマットされたサイズ文字列
-        """
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        elif size < 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size / (1024 * 1024 * 1024):.1f} GB"
-    
     def _update_button_states(self, message: MailMessage):
         """
         ボタンの状態を更新します
@@ -749,8 +1429,7 @@ class MailViewer(ttk.Frame):
         """
         if message:
             # 基本ステータス
-            status_text = f"件名: {message.subject}"
-            self.status_label.config(text=status_text)
+            self.status_label.config(text=self._get_header_view(message).status)
             
             # メール情報
             flags = []
@@ -771,28 +1450,21 @@ class MailViewer(ttk.Frame):
         """
         空のメッセージ表示を行います
         """
-        self.subject_label.config(text="メールを選択してください")
-        self.sender_label.config(text="")
-        self.recipient_label.config(text="")
-        self.date_label.config(text="")
-        
-        self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.delete(1.0, tk.END)
-        self.text_widget.insert(1.0, """🌸 WabiMail メール表示
-
-静かで美しいメール読書体験をお楽しみください。
-
-左のメール一覧からメールを選択すると、
-ここに詳細な内容が表示されます。
-
-侘び寂びの美学に基づいた、
-シンプルで心地よいインターフェースです。
-
---
-静寂の中の美しさを追求して""")
-        self.text_widget.config(state=tk.DISABLED)
-        
-        self.attachments_frame.pack_forget()
+        for label, text in ((self.subject_label, "メールを選択してください"),
+                            (self.sender_label, ""),
+                            (self.recipient_label, ""),
+                            (self.date_label, "")):
+            label.config(text=text)
+        self._last_header_view = None
+        
+        self._reset_body_render()
+        with self._editable(self.text_widget):
+            self.text_widget.delete(1.0, tk.END)
+            self.text_widget.insert(1.0, _EMPTY_BODY)
+        
+        if self.attachments_frame is not None:
+            self.attachments_frame.pack_forget()
+        self._selected_attachment = None
         self._update_button_states(None)
         self._update_status(None)
     
@@ -803,10 +1475,10 @@ class MailViewer(ttk.Frame):
         Args:
             error: エラーメッセージ
         """
-        self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.delete(1.0, tk.END)
-        self.text_widget.insert(1.0, f"❌ エラー\n\n{error}")
-        self.text_widget.config(state=tk.DISABLED)
+        self._reset_body_render()
+        with self._editable(self.text_widget):
+            self.text_widget.delete(1.0, tk.END)
+            self.text_widget.insert(1.0, f"❌ エラー\n\n{error}")
     
     # イベントハンドラー
     def _on_reply_click(self):
@@ -830,7 +1502,8 @@ class MailViewer(ttk.Frame):
             result = messagebox.askyesno(
                 "確認", 
                 f"「{self.current_message.subject}」を削除しますか？",
-                icon=messagebox.QUESTION
+                icon=messagebox.QUESTION,
+                parent=self
             )
             if result:
                 self.on_delete(self.current_message)
@@ -842,6 +1515,7 @@ class MailViewer(ttk.Frame):
                 self.current_message.remove_flag(MessageFlag.FLAGGED)
             else:
                 self.current_message.add_flag(MessageFlag.FLAGGED)
+            self._dirty = True
             
             self._update_button_states(self.current_message)
             self._update_status(self.current_message)
@@ -862,17 +1536,35 @@ class MailViewer(ttk.Frame):
         percentage = int(zoom * 100)
         self.zoom_label.config(text=f"{percentage}%")
         
+        # 本文の再レイアウトはスライダーが止まってから1回だけ行う
+        if self._zoom_after_id is not None:
+            self.after_cancel(self._zoom_after_id)
+        self._zoom_after_id = self.after(80, self._apply_zoom, zoom)
+    
+    def _apply_zoom(self, zoom: float):
+        """
+        ズーム倍率を本文のフォントに反映します
+        
+        Args:
+            zoom: ズーム倍率
+        """
+        self._zoom_after_id = None
+        
         # フォントサイズを調整
         base_size = 10
         new_size = int(base_size * zoom)
-        new_font = (self.fonts['body'][0], new_size)
         
-        self.text_widget.config(font=new_font)
+        # 本文の名前付きフォントのサイズを変えるだけで、ウィジェットに反映される
+        self.font_objs['text'].configure(size=new_size)
     
     def _on_link_click(self, event):
         """リンククリックイベント"""
-        # 現在の実装では何もしない（_open_urlで処理）
-        pass
+        pos = _text_pos(self.text_widget.index(f"@{event.x},{event.y}"))
+        i = bisect_right(self._url_ranges, pos, key=itemgetter(0)) - 1
+        if i >= 0:
+            start, end, url = self._url_ranges[i]
+            if pos < end:
+                self._open_url(url)
     
     def _on_link_enter(self, event):
         """リンクマウスエンターイベント"""
@@ -883,29 +1575,41 @@ class MailViewer(ttk.Frame):
         self.text_widget.config(cursor="")
     
     def _open_url(self, url: str):
-        """URLを開きます"""
+        """URLを開きます（ブラウザの起動はワーカースレッドで行います）"""
+        future = self._io_pool.submit(webbrowser.open, url)
+        future.add_done_callback(lambda f: self._post_io_error("URLを開けませんでした", f))
+    
+    def _post_io_error(self, message: str, future):
+        """
+        I/O処理が失敗した場合にエラーをメインスレッドで表示します（ワーカースレッドから呼ばれる）
+        
+        Args:
+            message: エラーメッセージの見出し
+            future: I/O処理のFuture
+        """
+        if future.cancelled() or future.exception() is None:
+            return
+        
+        text = f"{message}: {future.exception()}"
         try:
-            webbrowser.open(url)
-        except Exception as e:
-            messagebox.showerror("エラー", f"URLを開けませんでした: {e}")
+            self.after(0, lambda: messagebox.showerror("エラー", text, parent=self))
+        except (RuntimeError, tk.TclError):
+            # ウィジェット破棄後は何もしない
+            pass
     
     # 添付ファイル関連イベント
-    def _on_save_attachment(self):
-        """添付ファイル保存イベント"""
+    def _on_attachment_select(self, event):
+        """添付ファイル選択イベント（選択中の添付ファイルを覚えておく）"""
         selection = self.attachments_tree.selection()
         if not selection or not self.current_message:
-            return
-        
-        item = selection[0]
-        filename = self.attachments_tree.item(item, "values")[0]
-        
-        # 対応する添付ファイルを検索
-        attachment = None
-        for att in self.current_message.attachments:
-            if att.filename == filename:
-                attachment = att
-                break
-        
+            self._selected_attachment = None
+        else:
+            # 行IDは添付ファイルの位置
+            self._selected_attachment = self.current_message.attachments[int(selection[0])]
+    
+    def _on_save_attachment(self):
+        """添付ファイル保存イベント"""
+        attachment = self._selected_attachment
         if attachment:
             self._save_attachment_to_file(attachment)
     
@@ -914,28 +1618,82 @@ class MailViewer(ttk.Frame):
         if not self.current_message or not self.current_message.has_attachments():
             return
         
+        # 前回のすべて保存が終わるまでは受け付けない
+        if self._save_all_task is not None:
+            return
+        
         # ディレクトリ選択
-        directory = filedialog.askdirectory(title="保存先ディレクトリを選択")
+        directory = filedialog.askdirectory(title=_TITLE_SAVE_DIR, parent=self)
         if directory:
-            for attachment in self.current_message.attachments:
-                self._save_attachment_to_directory(attachment, directory)
+            # 書き込み先とデータを先にまとめ、書き込みはI/Oスレッドで順に進める。
+            # 進行状況は定期的に確認して表示する
+            # 同名の添付ファイル（ディレクトリ部分を除くと同名になるものを含む）が
+            # 同じファイルへ同時に書き込まれないよう、保存名を重ならないようにする
+            prefix = os.path.join(directory, "")
+            attachments = [attachment for attachment in self.current_message.attachments if attachment.data]
+            names = _unique_filenames([_safe_filename(attachment.filename) for attachment in attachments])
+            jobs = [(prefix + name, attachment.data) for name, attachment in zip(names, attachments)]
+            self._save_all_task = _SaveAllTask(self._io_pool, jobs)
+            
+            self.save_all_button.config(state=tk.DISABLED)
+            self.save_all_progress.config(maximum=max(len(jobs), 1), value=0)
+            self.save_all_progress.pack(side=tk.LEFT, padx=(0, 4))
+            self.cancel_save_all_button.pack(side=tk.LEFT, padx=(0, 4))
+            self._poll_save_all()
     
-    def _on_open_attachment(self):
-        """添付ファイルを開くイベント"""
-        selection = self.attachments_tree.selection()
-        if not selection or not self.current_message:
+    def _on_cancel_save_all(self):
+        """すべて保存の中止イベント"""
+        if self._save_all_task is not None:
+            self._save_all_task.cancel()
+    
+    def _poll_save_all(self):
+        """
+        すべて保存の進行状況を表示し、終わっていれば結果を表示します
+        """
+        self._save_all_after_id = None
+        task = self._save_all_task
+        if task is None:
+            return
+        
+        self.save_all_progress.config(value=task.finished)
+        if not task.done:
+            self.status_label.config(text=f"添付ファイルを保存中…（{task.finished}/{task.total}件）")
+            self._save_all_after_id = self.after(SAVE_ALL_POLL_MS, self._poll_save_all)
             return
         
-        item = selection[0]
-        filename = self.attachments_tree.item(item, "values")[0]
+        self._show_save_all_result(task)
+    
+    def _show_save_all_result(self, task: _SaveAllTask):
+        """
+        すべて保存の結果を表示します
         
-        # 対応する添付ファイルを検索
-        attachment = None
-        for att in self.current_message.attachments:
-            if att.filename == filename:
-                attachment = att
-                break
+        Args:
+            task: 終了したすべて保存のタスク
+        """
+        self._save_all_task = None
+        self.save_all_progress.pack_forget()
+        self.cancel_save_all_button.pack_forget()
+        self.save_all_button.config(state=tk.NORMAL)
         
+        if task.cancelled:
+            summary = f"添付ファイルの保存を中止しました（{task.saved}/{task.total}件）"
+        else:
+            summary = f"添付ファイルを保存しました（{task.saved}/{task.total}件）"
+        self.status_label.config(text=summary)
+        
+        # 結果はファイルごとではなく、まとめて1回だけ知らせる
+        if task.failures:
+            listed = task.failures[:SAVE_ALL_MAX_LISTED_FAILURES]
+            if len(task.failures) > len(listed):
+                listed.append(f"ほか{len(task.failures) - len(listed)}件")
+            messagebox.showwarning("警告", summary + "\n\n保存できなかったファイル:\n" + "\n".join(listed),
+                                   parent=self)
+        elif not task.cancelled:
+            messagebox.showinfo("成功", summary, parent=self)
+    
+    def _on_open_attachment(self):
+        """添付ファイルを開くイベント"""
+        attachment = self._selected_attachment
         if attachment:
             self._open_attachment_temp(attachment)
     
@@ -943,62 +1701,115 @@ class MailViewer(ttk.Frame):
         """添付ファイルダブルクリックイベント"""
         self._on_open_attachment()
     
+    def _check_attachment_data(self, attachment: MailAttachment) -> bool:
+        """
+        添付ファイルのデータがあるか確認し、なければ警告を表示します
+        
+        Args:
+            attachment: 対象の添付ファイル
+            
+        Returns:
+            bool: データがある場合True
+        """
+        if attachment.data:
+            return True
+        messagebox.showwarning("警告", _WARN_NO_DATA, parent=self)
+        return False
+    
     def _save_attachment_to_file(self, attachment: MailAttachment):
         """添付ファイルを指定ファイルに保存"""
-        if not attachment.data:
-            messagebox.showwarning("警告", "添付ファイルのデータが利用できません")
+        if not self._check_attachment_data(attachment):
             return
         
         # ファイル保存ダイアログ
         filename = filedialog.asksaveasfilename(
             title=f"添付ファイルを保存: {attachment.filename}",
-            initialname=attachment.filename,
-            filetypes=[("すべてのファイル", "*.*")]
+            initialfile=_safe_filename(attachment.filename),
+            filetypes=_SAVE_FILETYPES,
+            parent=self
         )
         
         if filename:
-            try:
-                with open(filename, 'wb') as f:
-                    f.write(attachment.data)
-                messagebox.showinfo("成功", f"添付ファイルを保存しました:\n{filename}")
-            except Exception as e:
-                messagebox.showerror("エラー", f"ファイル保存エラー: {e}")
-    
-    def _save_attachment_to_directory(self, attachment: MailAttachment, directory: str):
-        """添付ファイルを指定ディレクトリに保存"""
-        if not attachment.data:
-            return
+            # 書き込みはI/Oスレッドで行い、結果はメインスレッドで表示する
+            future = self._io_pool.submit(_write_file, filename, attachment.data)
+            future.add_done_callback(lambda f: self._post_save_result(filename, f))
+    
+    def _post_save_result(self, filename: str, future):
+        """
+        添付ファイルの保存結果をメインスレッドへ渡します（ワーカースレッドから呼ばれる）
         
+        Args:
+            filename: 保存先のパス
+            future: 保存処理のFuture
+        """
         try:
-            filepath = os.path.join(directory, attachment.filename)
-            with open(filepath, 'wb') as f:
-                f.write(attachment.data)
-        except Exception as e:
-            logger.error(f"添付ファイル保存エラー: {e}")
+            self.after(0, self._show_save_result, filename, future)
+        except (RuntimeError, tk.TclError):
+            # ウィジェット破棄後は何もしない
+            pass
+    
+    def _show_save_result(self, filename: str, future):
+        """
+        添付ファイルの保存結果を表示します
+        
+        Args:
+            filename: 保存先のパス
+            future: 保存処理のFuture
+        """
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        if error is None:
+            messagebox.showinfo("成功", f"添付ファイルを保存しました:\n{filename}", parent=self)
+        else:
+            messagebox.showerror("エラー", f"ファイル保存エラー: {error}", parent=self)
+    
+    def _get_temp_dir(self) -> str:
+        """
+        添付ファイルを開くための一時ディレクトリを取得します（なければ作成）
+        
+        ディレクトリはビューアごとに1つで、破棄時（または終了時）に削除されます。
+        
+        Returns:
+            str: 一時ディレクトリのパス
+        """
+        if self._tmp_dir is None:
+            self._tmp_dir = tempfile.TemporaryDirectory(prefix="wabimail_", ignore_cleanup_errors=True)
+        return self._tmp_dir.name
     
     def _open_attachment_temp(self, attachment: MailAttachment):
         """添付ファイルを一時ファイルとして開く"""
-        if not attachment.data:
-            messagebox.showwarning("警告", "添付ファイルのデータが利用できません")
+        if not self._check_attachment_data(attachment):
             return
         
         try:
-            # 一時ファイルを作成
-            temp_dir = tempfile.mkdtemp()
-            temp_file = os.path.join(temp_dir, attachment.filename)
-            
-            with open(temp_file, 'wb') as f:
-                f.write(attachment.data)
-            
-            # システムデフォルトアプリで開く
-            if os.name == 'nt':  # Windows
-                os.startfile(temp_file)
-            elif os.name == 'posix':  # macOS, Linux
-                os.system(f'open "{temp_file}"' if 'darwin' in os.uname().sysname.lower() 
-                         else f'xdg-open "{temp_file}"')
-                
+            temp_file = os.path.join(self._get_temp_dir(), _safe_filename(attachment.filename))
         except Exception as e:
-            messagebox.showerror("エラー", f"ファイルを開けませんでした: {e}")
+            messagebox.showerror("エラー", f"ファイルを開けませんでした: {e}", parent=self)
+            return
+        
+        # 一時ファイルへの書き込みとアプリの起動はI/Oスレッドで行う。
+        # 同じ添付ファイルを書き込み済みであれば、書き込まずにそのまま開く
+        if self._temp_files.get(temp_file) is attachment.data and os.path.exists(temp_file):
+            future = self._io_pool.submit(_open_with_default_app, temp_file)
+        else:
+            self._temp_files[temp_file] = attachment.data
+            future = self._io_pool.submit(_write_and_open, temp_file, attachment.data)
+        future.add_done_callback(lambda f: self._on_temp_open_done(temp_file, f))
+    
+    def _on_temp_open_done(self, temp_file: str, future):
+        """
+        添付ファイルを開く処理の完了時の処理（ワーカースレッドから呼ばれる）
+        
+        Args:
+            temp_file: 一時ファイルのパス
+            future: 書き込み・起動処理のFuture
+        """
+        if future.cancelled() or future.exception() is not None:
+            # 書き込みが完了したとは限らないため、次回は書き直す
+            self._temp_files.pop(temp_file, None)
+        self._post_io_error("ファイルを開けませんでした", future)
 
 
 # ユーティリティ関数
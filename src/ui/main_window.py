@@ -13,6 +13,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from typing import List, Optional, Dict, Any
 import threading
+from collections import defaultdict
 from datetime import datetime
 
 from src.mail.account import Account
@@ -60,6 +61,10 @@ class WabiMailMainWindow:
         self.current_messages: List[MailMessage] = []
         self.selected_message: Optional[MailMessage] = None
         
+        # フラグ反映用のIMAP接続（アカウントID → クライアント）。
+        # MailListのフラグ用ワーカースレッドからのみ使用し、バッチ間で使い回す
+        self._flag_clients: Dict[str, Any] = {}
+        
         # UI要素の参照
         self.account_tree = None
         self.mail_list = None
@@ -311,7 +316,8 @@ class WabiMailMainWindow:
         self.mail_list = MailList(list_frame,
                                  on_selection_change=self._on_mail_selection_change,
                                  on_double_click=self._on_mail_double_click,
-                                 on_context_menu=self._on_mail_context_menu)
+                                 on_context_menu=self._on_mail_context_menu,
+                                 on_flags_change=self._on_mail_flags_change)
         self.mail_list.pack(fill=tk.BOTH, expand=True)
     
     def _create_message_view_pane(self):
@@ -717,7 +723,82 @@ WabiMailは、この精神をデジタルの世界に取り入れ、
         elif action == "forward":
             self._on_mail_forward(data)
         elif action == "delete":
-            self._on_mail_delete(data)
+            # 確認はMailList側で済んでいる
+            self._on_mail_delete(data, confirm=False)
+    
+    def _on_mail_flags_change(self, messages: List[MailMessage], add_flags, remove_flags) -> bool:
+        """
+        メールフラグ変更処理
+        
+        同じアカウント・フォルダのメッセージをまとめてサーバーへ反映します。
+        反映先はメッセージのアカウントIDから求めるため、要求後にアカウントを
+        切り替えても元のアカウントのサーバーへ送られます。
+        MailListのワーカースレッドから呼ばれるため、UIには触れません。
+        
+        Args:
+            messages: 対象メッセージリスト（同一アカウント・フォルダ）
+            add_flags: 追加するフラグ
+            remove_flags: 削除するフラグ
+            
+        Returns:
+            bool: 反映に成功した場合（サーバー上にないメッセージを含む）True
+        """
+        uids = [message.uid for message in messages if message.uid]
+        account = self.account_manager.get_account_by_id(messages[0].account_id) if uids else None
+        if not account:
+            # サンプルデータなどサーバー上にないメッセージはローカルのみ更新
+            return True
+        
+        add_values = tuple(flag.value for flag in add_flags)
+        remove_values = tuple(flag.value for flag in remove_flags)
+        
+        # 使い回した接続が切れていることがあるため、失敗時は接続し直して1回だけ再試行
+        for _ in range(2):
+            client = self._get_flag_client(account)
+            if not client:
+                # IMAP以外のアカウントではフラグはローカルのみで管理
+                return True
+            
+            if client.is_connected() and client.batch_update_flags(
+                    messages[0].folder, uids,
+                    add_flags=add_values, remove_flags=remove_values):
+                return True
+            
+            self._close_flag_client(account.account_id)
+        
+        return False
+    
+    def _get_flag_client(self, account: Account):
+        """
+        フラグ反映用のIMAPクライアントを取得します（なければ接続）
+        
+        Args:
+            account: 対象アカウント
+            
+        Returns:
+            Optional[IMAPClient]: IMAPクライアント、IMAP以外のアカウントではNone
+        """
+        client = self._flag_clients.get(account.account_id)
+        if client is not None and client.account is account and client.is_connected():
+            return client
+        
+        self._close_flag_client(account.account_id)
+        client = MailClientFactory.create_imap_client(account)
+        if client:
+            client.connect()
+            self._flag_clients[account.account_id] = client
+        return client
+    
+    def _close_flag_client(self, account_id: str):
+        """
+        フラグ反映用のIMAP接続を切断して破棄します
+        
+        Args:
+            account_id: 対象アカウントID
+        """
+        client = self._flag_clients.pop(account_id, None)
+        if client is not None:
+            client.disconnect()
     
     def _on_mail_reply(self, data, reply_all=False):
         """
@@ -829,16 +910,19 @@ WabiMailは、この精神をデジタルの世界に取り入れ、
                 parent=self.root
             )
     
-    def _on_mail_delete(self, data):
+    def _on_mail_delete(self, data, confirm: bool = True):
         """
         メール削除処理
         
         Args:
             data: 削除対象のメッセージまたはメッセージリスト
+            confirm: 確認ダイアログを表示するか
         """
         messages = data if isinstance(data, list) else [data] if data else []
         if messages:
-            if len(messages) == 1:
+            if not confirm:
+                result = True
+            elif len(messages) == 1:
                 result = messagebox.askyesno("確認", 
                                            f"「{messages[0].subject}」を削除しますか？",
                                            icon=messagebox.QUESTION)
@@ -848,11 +932,72 @@ WabiMailは、この精神をデジタルの世界に取り入れ、
                                            icon=messagebox.QUESTION)
             
             if result:
+                # サーバー上のメッセージはフォルダごとに1回の要求でまとめて削除
+                local_messages = []
+                messages_by_folder = defaultdict(list)
                 for message in messages:
                     logger.info(f"メール削除処理: {message.subject}")
-                    # TODO: 実際の削除処理
-                    pass
-                self._update_status(f"{len(messages)}件のメッセージを削除しました")
+                    if message.uid and self.current_account:
+                        messages_by_folder[message.folder].append(message)
+                    else:
+                        # サンプルデータなどサーバー上にないメッセージは一覧から取り除くだけ
+                        local_messages.append(message)
+                
+                if not messages_by_folder:
+                    self._finish_mail_delete(local_messages, [])
+                    return
+                
+                account = self.current_account
+                
+                def delete_in_background():
+                    """
+                    バックグラウンドでサーバー上のメッセージを削除します
+                    """
+                    deleted = list(local_messages)
+                    done_folders = set()
+                    try:
+                        client = MailClientFactory.create_imap_client(account)
+                        if not client:
+                            # IMAP以外のアカウントではローカルのみで削除
+                            for folder, folder_messages in messages_by_folder.items():
+                                deleted.extend(folder_messages)
+                                done_folders.add(folder)
+                        else:
+                            with client:
+                                for folder, folder_messages in messages_by_folder.items():
+                                    if client.batch_delete(folder, [m.uid for m in folder_messages]):
+                                        deleted.extend(folder_messages)
+                                        done_folders.add(folder)
+                    except Exception as e:
+                        logger.error(f"メール削除エラー: {e}")
+                    
+                    failed_folders = [folder for folder in messages_by_folder if folder not in done_folders]
+                    
+                    # 一覧はサーバーでの削除結果が分かってから更新する
+                    self.root.after(0, lambda: self._finish_mail_delete(deleted, failed_folders))
+                
+                self._update_status(f"{len(messages)}件のメッセージを削除中...")
+                threading.Thread(target=delete_in_background, daemon=True).start()
+    
+    def _finish_mail_delete(self, deleted: List[MailMessage], failed_folders: List[str]):
+        """
+        削除できたメッセージを一覧から取り除き、結果を表示します
+        
+        Args:
+            deleted: 削除できたメッセージリスト
+            failed_folders: サーバー上で削除できなかったフォルダ名のリスト
+        """
+        if deleted:
+            # 一覧からはまとめて1回で取り除く
+            deleted_ids = {message.message_id for message in deleted}
+            self.current_messages = [m for m in self.current_messages if m.message_id not in deleted_ids]
+            self.mail_list.remove_messages(list(deleted_ids))
+        
+        if failed_folders:
+            self._update_status(f"⚠️ サーバー上のメッセージを削除できませんでした: {', '.join(failed_folders)}"
+                                f"（{len(deleted)}件は削除しました）")
+        else:
+            self._update_status(f"{len(deleted)}件のメッセージを削除しました")
     
     def _on_search(self, event):
         """
@@ -1109,6 +1254,8 @@ WabiMailは、この精神をデジタルの世界に取り入れ、
         ウィンドウ終了処理
         """
         logger.info("WabiMailを終了します")
+        for account_id in list(self._flag_clients):
+            self._close_flag_client(account_id)
         self.root.destroy()
     
     def run(self):
@@ -14,7 +14,7 @@ import os
 from pathlib import Path
 
 # テスト対象をインポート
-from src.ui.compose_window import ComposeWindow, show_compose_window
+from src.ui.compose_window import ComposeWindow, show_compose_window, _split_addresses, _text_has_content
 from src.mail.account import Account, AccountType, AuthType, AccountSettings
 from src.mail.mail_message import MailMessage, MailAttachment, MessageFlag
 
@@ -382,6 +382,63 @@ class TestComposeWindow(unittest.TestCase):
             self.skipTest("GUI環境が利用できません")
 
 
+class TestComposeHelpers(unittest.TestCase):
+    """メール作成ウィンドウの補助関数テストクラス"""
+    
+    def test_split_addresses(self):
+        """宛先分割テスト"""
+        self.assertEqual(_split_addresses(""), [])
+        self.assertEqual(_split_addresses("   "), [])
+        self.assertEqual(_split_addresses("a@example.com"), ["a@example.com"])
+        self.assertEqual(
+            _split_addresses(" a@example.com, ,b@example.com ,"),
+            ["a@example.com", "b@example.com"]
+        )
+        self.assertEqual(
+            _split_addresses("山田 <yamada@example.com>,c@example.com"),
+            ["山田 <yamada@example.com>", "c@example.com"]
+        )
+        # 全角スペース・改行も区切り前後の空白として除去
+        self.assertEqual(
+            _split_addresses("\u3000a@example.com\u3000,\nb@example.com\t"),
+            ["a@example.com", "b@example.com"]
+        )
+    
+    def test_text_has_content(self):
+        """本文の内容有無判定テスト"""
+        empty = Mock()
+        empty.count.return_value = None
+        self.assertFalse(_text_has_content(empty))
+        empty.search.assert_not_called()
+        
+        # 空白だけの本文は内容なし
+        blank = Mock()
+        blank.count.return_value = (3,)
+        blank.search.return_value = ""
+        self.assertFalse(_text_has_content(blank))
+        
+        body = Mock()
+        body.count.return_value = (5,)
+        body.search.return_value = "1.0"
+        self.assertTrue(_text_has_content(body))
+    
+    def test_unsaved_body_after_auto_save(self):
+        """自動保存後も本文があれば未保存として扱うテスト"""
+        window = ComposeWindow.__new__(ComposeWindow)
+        window.attachments = []
+        window.to_entry = Mock(**{"index.return_value": "0"})
+        window.subject_entry = Mock(**{"index.return_value": "0"})
+        window._html_mode_active = False
+        window.body_text = Mock(**{"count.return_value": (5,), "search.return_value": "1.0",
+                                   "edit_modified.return_value": False})
+        window.html_editor = Mock()
+        
+        self.assertTrue(window._has_unsaved_changes())
+        
+        window.body_text.count.return_value = None
+        self.assertFalse(window._has_unsaved_changes())
+
+
 class TestComposeWindowIntegration(unittest.TestCase):
     """メール作成ウィンドウ統合テストクラス"""
     
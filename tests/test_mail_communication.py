@@ -16,6 +16,7 @@ import sys
 from datetime import datetime
 import email
 from email.mime.text import MIMEText
+from unittest.mock import MagicMock
 
 # テスト用にプロジェクトルートをパスに追加
 project_root = Path(__file__).parent.parent
@@ -99,6 +100,13 @@ class TestMailMessage:
         
         message.remove_flag(MessageFlag.FLAGGED)
         assert not message.is_flagged()
+        
+        # まとめて更新
+        assert message.update_flags(add_flags=(MessageFlag.SEEN, MessageFlag.FLAGGED))
+        assert message.flags == [MessageFlag.SEEN, MessageFlag.FLAGGED]
+        assert message.update_flags(remove_flags=(MessageFlag.SEEN,))
+        assert message.flags == [MessageFlag.FLAGGED]
+        assert not message.update_flags(add_flags=(MessageFlag.FLAGGED,))
     
     def test_添付ファイル操作(self):
         """
@@ -271,6 +279,98 @@ class TestMailAttachment:
         assert "(インライン)" in attachment_str
 
 
+class TestIMAPClient:
+    """
+    IMAPClientクラスのテストケース
+    """
+    
+    def test_フラグ一括更新(self):
+        """
+        複数メッセージのフラグが1回のUID STOREで更新されることをテスト
+        """
+        account = Account(
+            name="IMAP Account",
+            email_address="test@example.com",
+            account_type=AccountType.IMAP
+        )
+        client = IMAPClient(account)
+        client._connection = MagicMock()
+        client._connection.uid.return_value = ('OK', [])
+        client._is_connected = True
+        client._current_folder = "INBOX"
+        
+        assert client.batch_update_flags("INBOX", ["1", "2", "3"], add_flags=("\\Seen",))
+        client._connection.uid.assert_called_once_with('STORE', "1,2,3", '+FLAGS', "(\\Seen)")
+        client._connection.store.assert_not_called()
+        
+        # 追加と削除はそれぞれ1回ずつ
+        client._connection.uid.reset_mock()
+        assert client.batch_update_flags("INBOX", ["4", "5"],
+                                         add_flags=("\\Flagged",), remove_flags=("\\Seen",))
+        assert client._connection.uid.call_count == 2
+        
+        # 失敗時はFalse
+        client._connection.uid.return_value = ('NO', [])
+        assert not client.batch_update_flags("INBOX", ["1"], add_flags=("\\Seen",))
+    
+    def test_一括削除(self):
+        """
+        複数メッセージが1回のUID STOREと1回のEXPUNGEで削除されることをテスト
+        """
+        account = Account(
+            name="IMAP Account",
+            email_address="test@example.com",
+            account_type=AccountType.IMAP
+        )
+        client = IMAPClient(account)
+        client._connection = MagicMock()
+        client._connection.uid.return_value = ('OK', [])
+        client._is_connected = True
+        client._current_folder = "INBOX"
+        
+        # UIDはExpungeで変わらないため、指定された順のまま1回で送る
+        assert client.batch_delete("INBOX", ["2", "10", "7"])
+        client._connection.uid.assert_called_once_with('STORE', "2,10,7", '+FLAGS', "(\\Deleted)")
+        client._connection.store.assert_not_called()
+        client._connection.expunge.assert_called_once_with()
+        
+        # 削除フラグを設定できなければExpungeしない
+        client._connection.uid.reset_mock()
+        client._connection.expunge.reset_mock()
+        client._connection.uid.return_value = ('NO', [])
+        assert not client.batch_delete("INBOX", ["3"])
+        client._connection.expunge.assert_not_called()
+    
+    def test_メッセージ取得はUIDを使用(self):
+        """
+        取得したメッセージにメッセージ番号ではなくUIDが設定されることをテスト
+        """
+        account = Account(
+            name="IMAP Account",
+            email_address="test@example.com",
+            account_type=AccountType.IMAP
+        )
+        client = IMAPClient(account)
+        client._connection = MagicMock()
+        client._connection.select.return_value = ('OK', [b'2'])
+        client._is_connected = True
+        
+        raw = MIMEText("本文").as_bytes()
+        
+        def uid_command(command, *args):
+            if command == 'SEARCH':
+                return 'OK', [b'101 205']
+            return 'OK', [(f'1 (UID {args[0].decode()} FLAGS (\\Seen) RFC822 {{{len(raw)}}}'.encode(), raw), b')']
+        
+        client._connection.uid.side_effect = uid_command
+        
+        messages = client.fetch_messages("INBOX")
+        
+        assert sorted(message.uid for message in messages) == ["101", "205"]
+        client._connection.search.assert_not_called()
+        client._connection.fetch.assert_not_called()
+
+
 class TestMailClientFactory:
     """
     MailClientFactoryクラスのテストケース
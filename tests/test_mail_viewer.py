@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+メール表示コンポーネントテストモジュール
+
+MailViewerの画面を使わない補助関数をテストします。
+"""
+
+import unittest
+
+# テスト対象をインポート
+from src.ui.mail_viewer import _safe_filename, _unique_filenames
+
+
+class TestMailViewerHelpers(unittest.TestCase):
+    """メール表示コンポーネントの補助関数テストクラス"""
+    
+    def test_safe_filename(self):
+        """添付ファイル名の無害化テスト"""
+        self.assertEqual(_safe_filename("report.pdf"), "report.pdf")
+        self.assertEqual(_safe_filename("請求書.pdf"), "請求書.pdf")
+        
+        # ディレクトリ部分は取り除き、保存先の外を指せないようにする
+        self.assertEqual(_safe_filename("../../etc/passwd"), "passwd")
+        self.assertEqual(_safe_filename("/etc/passwd"), "passwd")
+        
+        # バックスラッシュ区切りのパスも区切り文字を残さない（OSによらず）
+        safe = _safe_filename("..\\..\\Windows\\win.ini")
+        self.assertTrue(safe.endswith("win.ini"))
+        self.assertNotIn("\\", safe)
+        self.assertNotIn("/", safe)
+        self.assertNotIn(safe, ("", ".", ".."))
+        
+        # 名前として使えないものは既定の名前にする
+        self.assertEqual(_safe_filename(".."), "attachment")
+        self.assertEqual(_safe_filename("."), "attachment")
+        self.assertEqual(_safe_filename(""), "attachment")
+        self.assertEqual(_safe_filename("dir/"), "attachment")
+        self.assertEqual(_safe_filename("a/.."), "attachment")
+        
+        # 制御文字・Windowsの予約文字は'_'に置き換える
+        self.assertEqual(_safe_filename("a\x00b\tc\nd.txt"), "a_b_c_d.txt")
+        self.assertEqual(_safe_filename('a:b*c?"d<e>f|g.txt'), "a_b_c__d_e_f_g.txt")
+    
+    def test_unique_filenames(self):
+        """保存名の重複回避テスト"""
+        self.assertEqual(_unique_filenames([]), [])
+        self.assertEqual(_unique_filenames(["a.txt", "b.txt"]), ["a.txt", "b.txt"])
+        self.assertEqual(
+            _unique_filenames(["image.png", "image.png", "image.png"]),
+            ["image.png", "image (1).png", "image (2).png"]
+        )
+        # 拡張子なし・番号付きの名前と重なる場合
+        self.assertEqual(
+            _unique_filenames(["README", "README", "README (1)"]),
+            ["README", "README (1)", "README (1) (1)"]
+        )
+        # 大文字・小文字違いはOSによらず同名として扱う
+        self.assertEqual(
+            _unique_filenames(["Report.pdf", "report.pdf", "REPORT.PDF"]),
+            ["Report.pdf", "report (1).pdf", "REPORT (2).PDF"]
+        )
+
+
+if __name__ == '__main__':
+    # テスト実行
+    unittest.main(verbosity=2)